@@ -185,19 +185,15 @@ if start_button:
     results_container = st.container()
 
     try:
-        # Fetch URLs
+        # Fetch URLs, stopping as soon as enough unprocessed items are found
+        unprocessed_urls = []
         with st.spinner("Fetching URLs..."):
             status_text.info("Fetching URLs...")
-            article_urls = creator.get_article_urls()
-
-        # Filter unprocessed
-        status_text.info("Filtering processed items...")
-        unprocessed_urls = []
-        for url in article_urls:
-            if not creator.is_article_processed(url):
-                unprocessed_urls.append(url)
-                if len(unprocessed_urls) >= count:
-                    break
+            for url in creator.iter_article_urls(count):
+                if not creator.is_article_processed(url):
+                    unprocessed_urls.append(url)
+                    if len(unprocessed_urls) >= count:
+                        break
 
         total = len(unprocessed_urls)
 
@@ -229,9 +225,9 @@ if start_button:
                 # Display compact result
                 with results_container:
                     info_parts = [
-                        f"[{result['title']}]({result['presentation_url']})",
-                        f"{result['slide_count']} slides",
-                        f"{result.get('author', 'Unknown')}"
+                        f"[{result.title}]({result.presentation_url})",
+                        f"{result.slide_count} slides",
+                        f"{result.author}"
                     ]
                     st.success(" • ".join(info_parts))
 
@@ -245,7 +241,7 @@ if start_button:
         # Final status
         progress_bar.progress(1.0)
         if st.session_state.results:
-            total_slides = sum(r['slide_count'] for r in st.session_state.results)
+            total_slides = sum(r.slide_count for r in st.session_state.results)
             status_text.success(f"Complete: {len(st.session_state.results)}/{total} items • {total_slides} slides")
         else:
             status_text.warning("Completed with errors")
@@ -254,5 +250,7 @@ if start_button:
         st.error(f"Error: {str(e)}")
 
     finally:
+        # Send any queued folder moves and catalog rows
+        creator.flush()
         st.session_state.processing = False
         st.session_state.stop_requested = False
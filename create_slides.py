@@ -4,33 +4,309 @@ Creates Google Slides presentations from Socks Studio articles
 One presentation per article, with one slide per image
 """
 
+import asyncio
+import hashlib
+import math
 import os
 import re
 import sys
+import threading
 import time
 import requests
-from bs4 import BeautifulSoup
-from urllib.parse import urljoin
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from bs4 import BeautifulSoup, SoupStrainer
+from urllib.parse import urljoin, urlparse
 from pathlib import Path
-from anthropic import Anthropic
-import json
+import orjson
+from dataclasses import dataclass, asdict
+from itertools import islice
+from functools import lru_cache
+from types import MappingProxyType
 from datetime import datetime
 
-from google.oauth2.credentials import Credentials
-from google_auth_oauthlib.flow import InstalledAppFlow
-from google.auth.transport.requests import Request
-from googleapiclient.discovery import build
-from googleapiclient.errors import HttpError
-import pickle
+from tenacity import retry, retry_if_exception, stop_after_attempt, wait_exponential
 
 # Google API scopes
 SCOPES = ['https://www.googleapis.com/auth/presentations',
           'https://www.googleapis.com/auth/drive',
           'https://www.googleapis.com/auth/spreadsheets']
 
+# Number of listing pages fetched at once when crawling for article URLs;
+# the connection limit is what keeps the crawl polite to the host
+PAGE_FETCH_CONCURRENCY = 8
+
+# Patterns used while parsing pages, captions and LLM responses
+_YEAR_RE = re.compile(r'\b(1\d{3}|20\d{2})\b')
+# "Artist, Title[, rest]" where rest holds the year and/or medium
+_FIGCAP_RE = re.compile(r'^(?P<artist>[^,]*),(?P<title>[^,]*)(?:,(?P<rest>.*))?$', re.DOTALL)
+_POSSESSIVE_RE = re.compile(r"([A-ZÀ-ÿ][A-Za-zÀ-ÿ\s]+)['\u2019]s\s+")
+_COLLECTION_HREF_RE = re.compile(r'^/collection/[^/]+/$')
+_ARTIST_RE = re.compile(r'Artist:\s*(.+?)(?:\n|$)')
+_YEAR_LLM_RE = re.compile(r'Year:\s*(\d{4}|Unknown)')
+_MEDIUM_RE = re.compile(r'Medium:\s*(.+?)(?:\n|$)')
+_KEYWORDS_RE = re.compile(r'Keywords:\s*(.+?)(?:\n|$)', re.IGNORECASE)
+_DATE_YEAR_RE = re.compile(r'(\d{4})')
+_PAREN_YEAR_RE = re.compile(r'\(([^)]*\d{4}[^)]*)\)')
+_WIDTH_RE = re.compile(r'width=(\d+)')
+# Icons and logos, matched anywhere in an image URL
+_BLOCKED_SUBSTR_RE = re.compile(r'icon|logo', re.IGNORECASE)
+
+# Parts of a Socks Studio article page that the extractor reads
+_ARTICLE_STRAINER = SoupStrainer(['article', 'h1', 'h2', 'script'])
+
+# Concurrent HEAD requests used to check image sizes and reachability
+HEAD_CHECK_WORKERS = 16
+
+# Articles processed in parallel by run_batch, and how many of them may call the LLM at once.
+# Slides allows about 60 write requests per minute per user, so more workers
+# mostly end up waiting on rate-limit retries.
+ARTICLE_WORKERS = 4
+LLM_MAX_CONCURRENCY = 2
+
+# Minimum seconds between article page requests to the same host
+ARTICLE_FETCH_INTERVAL = 1.0
+
+# Slides sent per presentations.batchUpdate call, to bound request body size
+SLIDES_PER_BATCH_UPDATE = 50
+
+# Catalog rows buffered before they are appended to the sheet in one request
+CATALOG_FLUSH_SIZE = 50
+
+# Model used for metadata enhancement
+LLM_MODEL = "claude-3-5-haiku-20241022"
+
+# Characters of article text sent to the model
+LLM_EXCERPT_CHARS = 3000
+
+# Fixed part of the metadata extraction prompt; the article title and text are
+# sent in a separate content block after it
+LLM_METADATA_INSTRUCTIONS = """Read the article excerpt below and extract information about the artwork/project discussed.
+
+Please extract:
+1. The artist/creator name (the person whose work is featured, NOT the article author)
+2. The year or date when the artwork/project was created (not when the article was published)
+3. The medium or type of work (e.g., "Photography", "Architecture", "Drawing", "Installation", etc.)
+4. 3-5 keywords or tags that describe the main topics/themes (e.g., "urban landscape", "abstract geometry", "vernacular architecture")
+
+Respond in this exact format:
+Artist: [artist/creator name or "Unknown" if not found]
+Year: [year or "Unknown" if not found]
+Medium: [medium or "Unknown" if not found]
+Keywords: [comma-separated keywords, or "Unknown" if not found]
+
+Only include information that is explicitly stated in the text. Be concise."""
+
+# Fixed parts of the per-slide Slides API requests; create_presentation only
+# fills in object ids, the image URL and caption text. These are shared by
+# reference across slides, so they must never be mutated.
+# Slide: 10" x 5.625" (9144000 x 5143500 EMU) - Widescreen 16:9
+_BLANK_LAYOUT = {'predefinedLayout': 'BLANK'}
+_BLACK_BACKGROUND = {
+    'fields': 'pageBackgroundFill',
+    'pageProperties': {
+        'pageBackgroundFill': {
+            'solidFill': {'color': {'rgbColor': {'red': 0.0, 'green': 0.0, 'blue': 0.0}}}
+        }
+    }
+}
+# Image centered at top (no spacing), reserving 0.6" for the caption at the bottom.
+# Image box: 9" wide x 5.025" tall (allows landscape images to extend);
+# portrait images are constrained by height and centered within.
+# Centered horizontally: (10" - 9") / 2 = 0.5" = 457200 EMU
+_IMAGE_BOX = {
+    'size': {
+        'width': {'magnitude': 8229600, 'unit': 'EMU'},   # 9" wide (allows landscape)
+        'height': {'magnitude': 4594860, 'unit': 'EMU'}   # 5.025" height constraint
+    },
+    'transform': {'scaleX': 1, 'scaleY': 1, 'translateX': 457200, 'translateY': 0, 'unit': 'EMU'}
+}
+# Caption box directly below the image: 7.5" x 0.6" at Y = 5.025" (4594860 EMU)
+_CAPTION_BOX = {
+    'size': {
+        'width': {'magnitude': 6858000, 'unit': 'EMU'},   # 7.5" (leave room for link)
+        'height': {'magnitude': 548640, 'unit': 'EMU'}    # 0.6"
+    },
+    'transform': {'scaleX': 1, 'scaleY': 1, 'translateX': 0, 'translateY': 4594860, 'unit': 'EMU'}
+}
+# Source link to the right of the caption: 2.5" x 0.6" at X = 7.5" (6858000 EMU)
+_LINK_BOX = {
+    'size': {
+        'width': {'magnitude': 2286000, 'unit': 'EMU'},   # 2.5"
+        'height': {'magnitude': 548640, 'unit': 'EMU'}    # Match caption height (0.6")
+    },
+    'transform': {'scaleX': 1, 'scaleY': 1, 'translateX': 6858000, 'translateY': 4594860, 'unit': 'EMU'}
+}
+_ALL_TEXT = {'type': 'ALL'}
+# Caption: 9pt, light gray on black
+_CAPTION_TEXT_STYLE = {
+    'fields': 'fontSize,foregroundColor',
+    'style': {
+        'fontSize': {'magnitude': 9, 'unit': 'PT'},
+        'foregroundColor': {'opaqueColor': {'rgbColor': {'red': 0.85, 'green': 0.85, 'blue': 0.85}}}
+    },
+    'textRange': _ALL_TEXT
+}
+# Link: 9pt, dark gray on black (the URL is added per presentation)
+_LINK_TEXT_STYLE = {
+    'fontSize': {'magnitude': 9, 'unit': 'PT'},
+    'foregroundColor': {'opaqueColor': {'rgbColor': {'red': 0.6, 'green': 0.6, 'blue': 0.6}}}
+}
+_ALIGN_BOTTOM = {'fields': 'contentAlignment', 'shapeProperties': {'contentAlignment': 'BOTTOM'}}
+_ALIGN_END = {'fields': 'alignment', 'style': {'alignment': 'END'}, 'textRange': _ALL_TEXT}
+
+# HTTP statuses worth retrying (rate limiting and transient server errors)
+RETRYABLE_STATUS_CODES = {429, 500, 502, 503, 504}
+
+
+def _is_retryable_http_error(error):
+    from googleapiclient.errors import HttpError
+    return isinstance(error, HttpError) and error.resp.status in RETRYABLE_STATUS_CODES
+
+
+@retry(stop=stop_after_attempt(6),
+       wait=wait_exponential(multiplier=1, min=1, max=32),
+       retry=retry_if_exception(_is_retryable_http_error),
+       reraise=True)
+def _execute(request):
+    """Execute a Google API request, backing off on rate limits and server errors"""
+    return request.execute()
+
+
+def _is_rate_limited(error):
+    from googleapiclient.errors import HttpError
+    return isinstance(error, HttpError) and error.resp.status == 429
+
+
+@retry(stop=stop_after_attempt(6),
+       wait=wait_exponential(multiplier=1, min=1, max=32),
+       retry=retry_if_exception(_is_rate_limited),
+       reraise=True)
+def _execute_create(request):
+    """Execute a create request, retrying only when it was rejected for rate limiting
+
+    A 5xx may arrive after the server already created the file, so retrying
+    those would leave duplicate presentations/folders/sheets behind.
+    """
+    return request.execute()
+
+
+class HTTP2Transport:
+    """httplib2.Http-compatible transport backed by a shared HTTP/2 httpx client
+
+    googleapiclient only calls request() and reads the (response, content) pair,
+    so concurrent Slides/Drive/Sheets calls can multiplex over one connection
+    per host instead of contending for pooled HTTP/1.1 connections.
+    """
+
+    def __init__(self, timeout=60):
+        import httplib2
+        import httpx
+
+        self.timeout = timeout
+        self._response_class = httplib2.Response
+        self._client = httpx.Client(
+            http2=True,
+            timeout=timeout,
+            limits=httpx.Limits(max_connections=32, max_keepalive_connections=16)
+        )
+
+    def request(self, uri, method='GET', body=None, headers=None,
+                redirections=5, connection_type=None, **kwargs):
+        response = self._client.request(
+            method, uri,
+            content=body,
+            headers=headers,
+            follow_redirects=redirections > 0
+        )
+        # httpx has already decoded the body, so drop the encoding/length headers
+        info = {k: v for k, v in response.headers.items()
+                if k not in ('content-encoding', 'content-length')}
+        info['status'] = str(response.status_code)
+        return self._response_class(info), response.content
+
+    def close(self):
+        self._client.close()
+
+
+@lru_cache(maxsize=4096)
+def _parse_caption(caption_text):
+    """Parse "Artist, Title, Year medium" captions (see parse_figcaption)
+
+    Galleries often repeat the same caption, so results are memoized and
+    wrapped read-only so a cached entry can't be modified by a caller.
+    """
+    result = {}
+
+    # Try to parse format: "Artist, Title, Year medium" in a single match
+    match = _FIGCAP_RE.match(caption_text)
+    if match:
+        artist, title, rest = match.group('artist', 'title', 'rest')
+        # First part is likely artist name
+        result['artist'] = artist.strip()
+
+        # Try to extract year (4 digits) from the title, then from the rest,
+        # and remove it from both
+        year_match = _YEAR_RE.search(title) or (rest and _YEAR_RE.search(rest))
+        if year_match:
+            year = year_match.group(1)
+            result['year'] = year
+            title = title.replace(year, '')
+            if rest:
+                rest = rest.replace(year, '')
+
+        result['title'] = title.strip()
+        # Medium is usually the last comma-separated part after the title
+        if rest is not None:
+            result['medium'] = rest.rpartition(',')[2].strip()
+
+    return MappingProxyType(result)
+
+
+_EMPTY_CAPTION = MappingProxyType({})
+
+
+def _fallback(value, default):
+    """Return value unless it is missing or 'Unknown', else default"""
+    return value if value and value != 'Unknown' else default
+
+
+class HostPacer:
+    """Spaces out requests to each host by a minimum interval, across threads"""
+
+    def __init__(self, interval):
+        self.interval = interval
+        self._lock = threading.Lock()
+        self._next_slot = {}  # host -> earliest time the next request may start
+
+    def wait(self, url):
+        host = urlparse(url).netloc
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot.get(host, now))
+            self._next_slot[host] = slot + self.interval
+        if slot > now:
+            time.sleep(slot - now)
+
+
+@dataclass(slots=True)
+class PresentationRecord:
+    """Tracking/catalog data for one created presentation"""
+    presentation_id: str
+    presentation_url: str
+    title: str
+    author: str = 'Unknown'
+    year: str = 'Unknown'
+    medium: str = 'Unknown'
+    keywords: str = ''
+    slide_count: int = 0
+    processed_date: str = ''
+
 class SocksStudioSlidesCreator:
-    def __init__(self, site='socks-studio'):
+    def __init__(self, site='socks-studio', use_llm_cache=True):
         self.site = site  # 'socks-studio' or 'public-domain-review'
+        self.use_llm_cache = use_llm_cache
 
         # Set base URL based on site
         if self.site == 'socks-studio':
@@ -39,20 +315,51 @@ class SocksStudioSlidesCreator:
             self.base_url = "https://publicdomainreview.org"
         else:
             raise ValueError(f"Unknown site: {site}")
+        self._base_origin = self.base_url.rstrip('/')
 
         self.session = requests.Session()
         self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'
+            'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36',
+            # 'br' needs the brotli package
+            'Accept-Encoding': 'br, gzip, deflate'
         })
+        # Oversized keep-alive pool for concurrent requests, with automatic
+        # retries on transient errors for idempotent requests
+        adapter = HTTPAdapter(
+            pool_connections=32,
+            pool_maxsize=32,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.3,
+                status_forcelist=(429, 500, 502, 503, 504),
+                allowed_methods=frozenset(['GET', 'HEAD'])
+            )
+        )
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
         self.slides_service = None
         self.drive_service = None
         self.sheets_service = None
         self.credentials_path = Path('credentials.json')
-        self.token_path = Path('token.pickle')
+        self.token_path = Path('token.json')
         self.anthropic_key_path = Path('anthropic_api_key.txt')
-        self.tracking_file = Path(f'processed_articles_{self.site}.json')
+        self.llm_cache_dir = Path('.llm_cache')  # LLM results keyed by a hash of the prompt inputs
+        self.page_cache_dir = Path('.page_cache')  # Validators and links for listing pages
+        self._page_cache = None
+        self.tracking_file = Path(f'processed_articles_{self.site}.jsonl')
+        self.legacy_tracking_file = Path(f'processed_articles_{self.site}.json')
+        self._processed = None  # In-memory copy of the tracking file, loaded on first use
+        self.drive_ids_file = Path(f'drive_ids_{self.site}.json')  # Cached folder/catalog IDs
         self.drive_folder_id = None  # Will be set after authentication
         self.catalog_sheet_id = None  # Will be set after creating/finding catalog
+        self._pending_rows = []  # Catalog rows not yet appended to the sheet
+        self._pending_moves = []  # New presentations not yet moved into the Drive folder
+        # Guards the tracking dict and pending rows/moves when articles are processed in parallel
+        self._write_lock = threading.RLock()
+        # Limits concurrent Anthropic calls to stay under its rate limits
+        self._llm_semaphore = threading.Semaphore(LLM_MAX_CONCURRENCY)
+        # Polite per-host pacing for article page fetches
+        self._article_pacer = HostPacer(ARTICLE_FETCH_INTERVAL)
 
         # Initialize Anthropic client for metadata enhancement
         # Try to read from file first, then fall back to environment variable
@@ -62,16 +369,24 @@ class SocksStudioSlidesCreator:
         else:
             api_key = os.environ.get('ANTHROPIC_API_KEY')
 
-        self.anthropic_client = Anthropic(api_key=api_key) if api_key else None
+        self.anthropic_client = None
+        if api_key:
+            from anthropic import Anthropic
+            self.anthropic_client = Anthropic(api_key=api_key)
 
     def authenticate(self):
         """Authenticate with Google API"""
+        from google.oauth2.credentials import Credentials
+        from google_auth_oauthlib.flow import InstalledAppFlow
+        from google.auth.transport.requests import Request
+        from googleapiclient.discovery import build
+        import google_auth_httplib2
+
         creds = None
 
         # Load existing token
         if self.token_path.exists():
-            with open(self.token_path, 'rb') as token:
-                creds = pickle.load(token)
+            creds = Credentials.from_authorized_user_info(orjson.loads(self.token_path.read_bytes()), SCOPES)
 
         # If no valid credentials, get new ones
         if not creds or not creds.valid:
@@ -100,27 +415,75 @@ class SocksStudioSlidesCreator:
                 creds = flow.run_local_server(port=0)
 
             # Save credentials
-            with open(self.token_path, 'wb') as token:
-                pickle.dump(creds, token)
-
-        # Build services
-        self.slides_service = build('slides', 'v1', credentials=creds)
-        self.drive_service = build('drive', 'v3', credentials=creds)
-        self.sheets_service = build('sheets', 'v4', credentials=creds)
+            self.token_path.write_text(creds.to_json())
+
+        # Build services on one shared, keep-alive HTTP/2 transport. Discovery
+        # documents come from the copies bundled with the client library, so
+        # building doesn't fetch or cache them over the network.
+        http = google_auth_httplib2.AuthorizedHttp(creds, http=HTTP2Transport())
+        discovery_options = {'http': http, 'static_discovery': True, 'cache_discovery': False}
+        self.slides_service = build('slides', 'v1', **discovery_options)
+        self.drive_service = build('drive', 'v3', **discovery_options)
+        self.sheets_service = build('sheets', 'v4', **discovery_options)
         print("✓ Authentication successful!")
 
+    def _load_drive_ids(self):
+        """Load cached Drive folder/catalog IDs (saves a list call for each on startup)"""
+        if self.drive_ids_file.exists():
+            return orjson.loads(self.drive_ids_file.read_bytes())
+        return {}
+
+    def _save_drive_id(self, key, file_id):
+        """Remember a Drive folder/catalog ID for the next run"""
+        drive_ids = self._load_drive_ids()
+        drive_ids[key] = file_id
+        self.drive_ids_file.write_bytes(orjson.dumps(drive_ids, option=orjson.OPT_INDENT_2))
+
+    def _cached_drive_id(self, key):
+        """Return a cached Drive ID if the file still exists and isn't trashed
+
+        A stale entry (deleted or trashed since the last run) is dropped so the
+        caller falls back to searching/creating.
+        """
+        from googleapiclient.errors import HttpError
+
+        drive_ids = self._load_drive_ids()
+        file_id = drive_ids.get(key)
+        if not file_id:
+            return None
+
+        try:
+            file = _execute(self.drive_service.files().get(fileId=file_id, fields='trashed'))
+            if not file.get('trashed'):
+                return file_id
+        except HttpError as error:
+            if error.resp.status != 404:
+                raise
+
+        print(f"Cached Drive ID for '{key}' is no longer valid, looking it up again")
+        del drive_ids[key]
+        self.drive_ids_file.write_bytes(orjson.dumps(drive_ids, option=orjson.OPT_INDENT_2))
+        return None
+
     def get_or_create_drive_folder(self, folder_name=None):
         """Get or create a Google Drive folder for presentations"""
         if folder_name is None:
             folder_name = self.site
 
+        cache_key = f'folder:{folder_name}'
+        folder_id = self._cached_drive_id(cache_key)
+        if folder_id:
+            print(f"✓ Using cached folder: '{folder_name}' (ID: {folder_id})")
+            self.drive_folder_id = folder_id
+            return folder_id
+
         # Search for existing folder
         query = f"name='{folder_name}' and mimeType='application/vnd.google-apps.folder' and trashed=false"
-        results = self.drive_service.files().list(
+        results = _execute(self.drive_service.files().list(
             q=query,
             spaces='drive',
             fields='files(id, name)'
-        ).execute()
+        ))
 
         folders = results.get('files', [])
 
@@ -133,83 +496,109 @@ class SocksStudioSlidesCreator:
                 'name': folder_name,
                 'mimeType': 'application/vnd.google-apps.folder'
             }
-            folder = self.drive_service.files().create(
+            folder = _execute_create(self.drive_service.files().create(
                 body=folder_metadata,
                 fields='id, name'
-            ).execute()
+            ))
             folder_id = folder['id']
             print(f"✓ Created new folder: '{folder_name}' (ID: {folder_id})")
 
+        self._save_drive_id(cache_key, folder_id)
         self.drive_folder_id = folder_id
         return folder_id
 
-    def move_presentation_to_folder(self, presentation_id, folder_id):
-        """Move a presentation into a specific Drive folder"""
-        # Get current parents
-        file = self.drive_service.files().get(
-            fileId=presentation_id,
-            fields='parents'
-        ).execute()
+    def move_presentation_to_folder(self, presentation_id, folder_id, previous_parents='root'):
+        """Move a presentation into a specific Drive folder
 
-        previous_parents = ','.join(file.get('parents', []))
+        Files created through the Slides/Sheets APIs start out in the root of
+        My Drive, so the parent to remove is known without fetching the file.
+        """
+        _execute(self._move_request(presentation_id, folder_id, previous_parents))
 
-        # Move to new folder
-        self.drive_service.files().update(
-            fileId=presentation_id,
+    def _move_request(self, file_id, folder_id, previous_parents='root'):
+        return self.drive_service.files().update(
+            fileId=file_id,
             addParents=folder_id,
             removeParents=previous_parents,
-            fields='id, parents'
-        ).execute()
+            fields='id'
+        )
+
+    def _migrate_legacy_tracking_file(self):
+        """Convert the old single-object JSON tracking file to JSON Lines"""
+        legacy = orjson.loads(self.legacy_tracking_file.read_bytes())
+
+        # Write to a temp file and rename so an interrupted migration can't leave a partial file
+        tmp_path = self.tracking_file.with_suffix('.tmp')
+        with open(tmp_path, 'wb') as f:
+            for article_url, record in legacy.items():
+                f.write(orjson.dumps({'url': article_url, **record}) + b'\n')
+        os.replace(tmp_path, self.tracking_file)
 
     def load_processed_articles(self):
-        """Load the tracking file of processed articles"""
+        """Load the tracking file of processed articles (one JSON object per line)
+
+        The file is only read on the first call; later calls return the
+        in-memory copy, which save_processed_article keeps up to date.
+        """
+        if self._processed is not None:
+            return self._processed
+
+        if not self.tracking_file.exists() and self.legacy_tracking_file.exists():
+            self._migrate_legacy_tracking_file()
+
+        processed = {}
         if self.tracking_file.exists():
-            with open(self.tracking_file, 'r', encoding='utf-8') as f:
-                return json.load(f)
-        return {}
+            with open(self.tracking_file, 'rb') as f:
+                for line in f:
+                    line = line.strip()
+                    if not line:
+                        continue
+                    try:
+                        record = orjson.loads(line)
+                    except orjson.JSONDecodeError:
+                        continue  # Truncated by an interrupted run
+                    processed[record.pop('url')] = record
+
+        self._processed = processed
+        return processed
 
     def save_processed_article(self, article_url, presentation_data):
-        """Save a processed article to the tracking file"""
-        processed = self.load_processed_articles()
-        processed[article_url] = {
-            'presentation_id': presentation_data['presentation_id'],
-            'presentation_url': presentation_data['presentation_url'],
-            'title': presentation_data['title'],
-            'author': presentation_data.get('author', 'Unknown'),
-            'year': presentation_data.get('year', 'Unknown'),
-            'medium': presentation_data.get('medium', 'Unknown'),
-            'keywords': presentation_data.get('keywords', ''),
-            'slide_count': presentation_data['slide_count'],
-            'processed_date': datetime.now().isoformat()
-        }
-        with open(self.tracking_file, 'w', encoding='utf-8') as f:
-            json.dump(processed, f, indent=2, ensure_ascii=False)
+        """Append a processed article to the tracking file"""
+        record = asdict(presentation_data)
+        with self._write_lock:
+            self.load_processed_articles()[article_url] = record
+            # Append-only: one line per article instead of rewriting the whole file
+            with open(self.tracking_file, 'ab') as f:
+                f.write(orjson.dumps({'url': article_url, **record}) + b'\n')
 
     def is_article_processed(self, article_url):
         """Check if an article has already been processed"""
-        processed = self.load_processed_articles()
-        return article_url in processed
+        return article_url in self.load_processed_articles()
 
     def get_or_create_catalog_sheet(self):
         """Get or create a Google Sheets catalog for all presentations"""
         # Create site-specific catalog name
         catalog_name = f"{self.site.replace('-', ' ').title()} Presentations Catalog"
 
+        sheet_id = self._cached_drive_id('catalog')
+        if sheet_id:
+            print(f"✓ Using cached catalog spreadsheet (ID: {sheet_id})")
+            self.catalog_sheet_id = sheet_id
+            return sheet_id
+
         # Search for existing catalog
         query = f"name='{catalog_name}' and mimeType='application/vnd.google-apps.spreadsheet' and trashed=false"
-        results = self.drive_service.files().list(
+        results = _execute(self.drive_service.files().list(
             q=query,
             spaces='drive',
             fields='files(id, name)'
-        ).execute()
+        ))
 
         sheets = results.get('files', [])
 
         if sheets:
             sheet_id = sheets[0]['id']
             print(f"✓ Found existing catalog spreadsheet (ID: {sheet_id})")
-            self.catalog_sheet_id = sheet_id
-            return sheet_id
         else:
             # Create new spreadsheet
             spreadsheet = {
@@ -225,10 +614,10 @@ class SocksStudioSlidesCreator:
                     }
                 }]
             }
-            spreadsheet = self.sheets_service.spreadsheets().create(
+            spreadsheet = _execute_create(self.sheets_service.spreadsheets().create(
                 body=spreadsheet,
                 fields='spreadsheetId'
-            ).execute()
+            ))
             sheet_id = spreadsheet['spreadsheetId']
 
             # Move to socks-studio folder
@@ -237,12 +626,12 @@ class SocksStudioSlidesCreator:
 
             # Add headers
             headers = [['Article URL', 'Presentation URL', 'Title', 'Author', 'Year', 'Medium', 'Keywords', 'Slides', 'Processed Date']]
-            self.sheets_service.spreadsheets().values().update(
+            _execute(self.sheets_service.spreadsheets().values().update(
                 spreadsheetId=sheet_id,
                 range='Presentations!A1:I1',
                 valueInputOption='RAW',
                 body={'values': headers}
-            ).execute()
+            ))
 
             # Format headers
             requests = [{
@@ -261,197 +650,356 @@ class SocksStudioSlidesCreator:
                     'fields': 'userEnteredFormat(backgroundColor,textFormat)'
                 }
             }]
-            self.sheets_service.spreadsheets().batchUpdate(
+            _execute(self.sheets_service.spreadsheets().batchUpdate(
                 spreadsheetId=sheet_id,
                 body={'requests': requests}
-            ).execute()
+            ))
 
             print(f"✓ Created new catalog spreadsheet (ID: {sheet_id})")
 
+        self._save_drive_id('catalog', sheet_id)
         self.catalog_sheet_id = sheet_id
         return sheet_id
 
     def add_to_catalog(self, article_url, presentation_data):
-        """Add a presentation entry to the catalog spreadsheet"""
+        """Queue a presentation entry for the catalog spreadsheet
+
+        Rows are appended in bulk by flush(), which runs automatically every
+        CATALOG_FLUSH_SIZE rows and must be called once processing finishes.
+        """
         if not self.catalog_sheet_id:
             return
 
-        row = [[
+        row = [
             article_url,
-            presentation_data['presentation_url'],
-            presentation_data['title'],
-            presentation_data.get('author', 'Unknown'),
-            presentation_data.get('year', 'Unknown'),
-            presentation_data.get('medium', 'Unknown'),
-            presentation_data.get('keywords', ''),
-            str(presentation_data['slide_count']),
-            presentation_data.get('processed_date', datetime.now().isoformat())
-        ]]
-
-        self.sheets_service.spreadsheets().values().append(
-            spreadsheetId=self.catalog_sheet_id,
-            range='Presentations!A:I',
-            valueInputOption='RAW',
-            insertDataOption='INSERT_ROWS',
-            body={'values': row}
-        ).execute()
-
-    def _get_socks_studio_urls(self, limit=None):
-        """Get article URLs from Socks Studio homepage (most recent first)"""
-        print("Fetching Socks Studio article URLs...")
-        article_urls = []
+            presentation_data.presentation_url,
+            presentation_data.title,
+            presentation_data.author,
+            presentation_data.year,
+            presentation_data.medium,
+            presentation_data.keywords,
+            str(presentation_data.slide_count),
+            presentation_data.processed_date or datetime.now().isoformat()
+        ]
+
+        with self._write_lock:
+            self._pending_rows.append(row)
+            if len(self._pending_rows) >= CATALOG_FLUSH_SIZE:
+                self.flush()
+
+    def flush(self):
+        """Send queued folder moves and catalog rows to Google"""
+        with self._write_lock:
+            if self._pending_moves and self.drive_folder_id:
+                def on_move(request_id, response, exception):
+                    if exception:
+                        print(f"Error moving presentation to folder: {exception}")
+
+                # Drive batch requests are limited to 100 calls each
+                for start in range(0, len(self._pending_moves), 100):
+                    batch = self.drive_service.new_batch_http_request(callback=on_move)
+                    for file_id in self._pending_moves[start:start + 100]:
+                        batch.add(self._move_request(file_id, self.drive_folder_id))
+                    _execute(batch)
+                self._pending_moves.clear()
+
+            if self._pending_rows and self.catalog_sheet_id:
+                _execute(self.sheets_service.spreadsheets().values().append(
+                    spreadsheetId=self.catalog_sheet_id,
+                    range='Presentations!A:I',
+                    valueInputOption='RAW',
+                    insertDataOption='INSERT_ROWS',
+                    body={'values': self._pending_rows}
+                ))
+                self._pending_rows.clear()
+
+    def _fast_join(self, href, base=None):
+        """urljoin with fast paths for absolute URLs and root-relative paths"""
+        if href.startswith(('http://', 'https://')):
+            return href
+        if href.startswith('/') and not href.startswith('//'):
+            return self._base_origin + href
+        return urljoin(base or self.base_url, href)
+
+    def _parse_html(self, html, parse_only=None):
+        """Parse HTML bytes with lxml, optionally building only the strained parts"""
+        return BeautifulSoup(html, 'lxml', parse_only=parse_only)
+
+    def _fetch_pages(self, urls, request_headers=None, parse=None):
+        """Fetch several pages concurrently
+
+        Returns (status, response headers, body) for each URL in the same order
+        as `urls`, or None for a page that failed to load. `request_headers`
+        optionally gives extra headers to send with each URL. If `parse` is
+        given, each downloaded body (but not a 304) is replaced by parse(body),
+        run in a worker thread so the event loop keeps downloading other pages.
+        """
+        import aiohttp
 
-        page = 1
-        while True:
-            if page == 1:
-                url = self.base_url
-            else:
-                url = f"{self.base_url}/page/{page}/"
+        if request_headers is None:
+            request_headers = [None] * len(urls)
 
+        async def fetch(session, url, headers):
             try:
-                response = self.session.get(url, timeout=10)
-                response.raise_for_status()
+                async with session.get(url, headers=headers) as response:
+                    if response.status != 304:
+                        response.raise_for_status()
+                    status, response_headers, body = response.status, response.headers.copy(), await response.read()
+                if parse and status != 304:
+                    body = await asyncio.to_thread(parse, body)
+                return status, response_headers, body
             except Exception as e:
-                print(f"Error fetching page {page}: {e}")
-                break
-
-            soup = BeautifulSoup(response.text, 'html.parser')
-            articles = soup.find_all('article')
-
-            if not articles:
-                break
-
-            for article in articles:
-                h2 = article.find('h2')
-                if h2:
-                    link = h2.find('a')
-                    if link and link.get('href'):
-                        article_url = urljoin(self.base_url, link['href'])
-                        if article_url not in article_urls:
-                            article_urls.append(article_url)
-                            if limit and len(article_urls) >= limit:
-                                return article_urls
-
-            page += 1
-            if page > 50:  # Safety limit
-                break
+                print(f"Error fetching {url}: {e}")
+                return None
+
+        async def fetch_all():
+            connector = aiohttp.TCPConnector(limit=PAGE_FETCH_CONCURRENCY)
+            timeout = aiohttp.ClientTimeout(total=10)
+            async with aiohttp.ClientSession(connector=connector, timeout=timeout,
+                                             headers=dict(self.session.headers)) as session:
+                return await asyncio.gather(*(fetch(session, url, headers)
+                                              for url, headers in zip(urls, request_headers)))
+
+        return asyncio.run(fetch_all())
+
+    def _load_page_cache(self):
+        """Load ETag/Last-Modified validators and extracted links for listing pages"""
+        if self._page_cache is None:
+            index_path = self.page_cache_dir / 'index.json'
+            self._page_cache = orjson.loads(index_path.read_bytes()) if index_path.exists() else {}
+        return self._page_cache
+
+    def _save_page_cache(self):
+        self.page_cache_dir.mkdir(exist_ok=True)
+        index_path = self.page_cache_dir / 'index.json'
+        tmp_path = index_path.with_suffix('.tmp')
+        tmp_path.write_bytes(orjson.dumps(self._page_cache))
+        os.replace(tmp_path, index_path)
+
+    def _fetch_listing_links(self, urls, extract_links):
+        """Fetch listing pages concurrently and return the links found on each
+
+        Pages are requested conditionally (If-None-Match/If-Modified-Since);
+        an unchanged page answers 304 and its cached links are reused without
+        downloading or parsing it. Returns a list of links per URL, or None for
+        a page that failed to load.
+        """
+        page_cache = self._load_page_cache()
+
+        request_headers = []
+        for url in urls:
+            entry = page_cache.get(url, {})
+            headers = {}
+            if entry.get('etag'):
+                headers['If-None-Match'] = entry['etag']
+            if entry.get('last_modified'):
+                headers['If-Modified-Since'] = entry['last_modified']
+            request_headers.append(headers)
+
+        pages = []
+        for url, result in zip(urls, self._fetch_pages(urls, request_headers, parse=extract_links)):
+            if result is None:
+                pages.append(None)
+                continue
 
-            time.sleep(0.5)
+            status, headers, links = result
+            if status == 304 and url in page_cache:
+                pages.append(page_cache[url]['links'])
+                continue
 
-        return article_urls
+            if headers.get('ETag') or headers.get('Last-Modified'):
+                page_cache[url] = {
+                    'etag': headers.get('ETag'),
+                    'last_modified': headers.get('Last-Modified'),
+                    'links': links
+                }
+            pages.append(links)
+
+        self._save_page_cache()
+        return pages
+
+    def _extract_socks_studio_listing_links(self, html):
+        """Article links from a Socks Studio listing page"""
+        soup = self._parse_html(html, SoupStrainer('article'))
+        links = []
+        for article in soup.find_all('article'):
+            h2 = article.find('h2')
+            if h2:
+                link = h2.find('a')
+                if link and link.get('href'):
+                    links.append(self._fast_join(link['href']))
+        return links
+
+    def _extract_public_domain_listing_links(self, html):
+        """Collection links from a Public Domain Review listing page"""
+        # Find collection links: <a href="/collection/[slug]/">
+        soup = self._parse_html(html, SoupStrainer('a', href=_COLLECTION_HREF_RE))
+        return [self._fast_join(link['href'])
+                for link in soup.find_all('a', href=_COLLECTION_HREF_RE)]
+
+    def _iter_listing_urls(self, page_urls, extract_links, links_per_page, limit=None):
+        """Yield unique links from listing pages in order, fetching pages in concurrent waves
+
+        Each wave is only requested once the previous one has been consumed,
+        so a caller that stops early never fetches the remaining pages. When
+        the caller expects to need only `limit` links, the first wave is cut
+        down to the pages that should hold them. Stops at the first failed or
+        empty page.
+        """
+        wave_size = PAGE_FETCH_CONCURRENCY
+        if limit:
+            wave_size = min(wave_size, math.ceil(limit / links_per_page))
 
-    def _get_public_domain_urls(self, limit=None):
-        """Get collection URLs from Public Domain Review image collections"""
+        seen = set()
+        wave_start = 0
+        while wave_start < len(page_urls):
+            urls = page_urls[wave_start:wave_start + wave_size]
+            wave_start += len(urls)
+            wave_size = PAGE_FETCH_CONCURRENCY
+
+            for links in self._fetch_listing_links(urls, extract_links):
+                if not links:
+                    return
+
+                for link in links:
+                    if link not in seen:
+                        seen.add(link)
+                        yield link
+
+    def _iter_socks_studio_urls(self, limit=None):
+        """Yield article URLs from Socks Studio homepage (most recent first)"""
+        print("Fetching Socks Studio article URLs...")
+        max_pages = 50  # Safety limit
+        page_urls = [self.base_url if page == 1 else f"{self.base_url}/page/{page}/"
+                     for page in range(1, max_pages + 1)]
+        # About 10 articles per listing page
+        return self._iter_listing_urls(page_urls, self._extract_socks_studio_listing_links, 10, limit)
+
+    def _iter_public_domain_urls(self, limit=None):
+        """Yield collection URLs from Public Domain Review image collections"""
         print("Fetching Public Domain Review collection URLs...")
-        collection_urls = []
-
         # PDR has 23 pages of image collections, 24 per page
         max_pages = 23
-        for page in range(1, max_pages + 1):
-            url = f"{self.base_url}/collections/images/{page}/"
-
-            try:
-                response = self.session.get(url, timeout=10)
-                response.raise_for_status()
-            except Exception as e:
-                print(f"Error fetching page {page}: {e}")
-                break
-
-            soup = BeautifulSoup(response.text, 'html.parser')
-
-            # Find collection links: <a href="/collection/[slug]/">
-            links = soup.find_all('a', href=re.compile(r'^/collection/[^/]+/$'))
+        page_urls = [f"{self.base_url}/collections/images/{page}/" for page in range(1, max_pages + 1)]
+        return self._iter_listing_urls(page_urls, self._extract_public_domain_listing_links, 24, limit)
 
-            if not links:
-                break
-
-            for link in links:
-                href = link.get('href')
-                if href:
-                    collection_url = urljoin(self.base_url, href)
-                    if collection_url not in collection_urls:
-                        collection_urls.append(collection_url)
-                        if limit and len(collection_urls) >= limit:
-                            return collection_urls
-
-            time.sleep(0.5)
-
-        return collection_urls
+    def iter_article_urls(self, limit=None):
+        """Lazily yield article/collection URLs (dispatches to site-specific method)
 
-    def get_article_urls(self, limit=None):
-        """Get article/collection URLs (dispatches to site-specific method)"""
+        `limit` is a hint for how many URLs the caller expects to use; it only
+        sizes the first batch of listing pages, iteration can still go further.
+        """
         if self.site == 'socks-studio':
-            return self._get_socks_studio_urls(limit)
+            return self._iter_socks_studio_urls(limit)
         elif self.site == 'public-domain-review':
-            return self._get_public_domain_urls(limit)
+            return self._iter_public_domain_urls(limit)
         else:
             raise ValueError(f"Unknown site: {self.site}")
 
-    def enhance_metadata_with_llm(self, soup, existing_metadata):
-        """Use Claude to extract missing date/medium and keywords from article text"""
-        if not self.anthropic_client:
-            return None
+    def get_article_urls(self, limit=None):
+        """Get article/collection URLs as a list, optionally only the first `limit`"""
+        return list(islice(self.iter_article_urls(limit), limit))
 
-        # Extract article text
+    def _article_excerpt(self, soup, limit=LLM_EXCERPT_CHARS):
+        """Return the first `limit` characters of the article text, one string per line
+
+        Equivalent to get_text(separator='\n', strip=True)[:limit] on the content
+        element, but stops walking the tree once enough text has been collected.
+        """
         content_div = soup.find('article') or soup.find('div', class_='entry-content') or soup.body
         if not content_div:
-            return None
-
-        # Get text content (limit to first 3000 chars to stay within reasonable token limits)
-        article_text = content_div.get_text(separator='\n', strip=True)[:3000]
+            return ''
+
+        parts = []
+        length = 0
+        for string in content_div.stripped_strings:
+            parts.append(string)
+            length += len(string) + 1
+            if length >= limit:
+                break
+        return '\n'.join(parts)[:limit]
 
-        try:
-            message = self.anthropic_client.messages.create(
-                model="claude-3-5-haiku-20241022",
-                max_tokens=300,
-                messages=[{
-                    "role": "user",
-                    "content": f"""Read this article excerpt and extract information about the artwork/project discussed.
+    def enhance_metadata_with_llm(self, soup, existing_metadata, text=None):
+        """Use Claude to extract missing date/medium and keywords from article text
 
-Article title: {existing_metadata['title']}
-Article text excerpt:
-{article_text}
+        Pass `text` (from _article_excerpt) when the caller already has it,
+        to skip extracting it from `soup` again.
+        """
+        if not self.anthropic_client:
+            return None
 
-Please extract:
-1. The artist/creator name (the person whose work is featured, NOT the article author)
-2. The year or date when the artwork/project was created (not when the article was published)
-3. The medium or type of work (e.g., "Photography", "Architecture", "Drawing", "Installation", etc.)
-4. 3-5 keywords or tags that describe the main topics/themes (e.g., "urban landscape", "abstract geometry", "vernacular architecture")
+        # Get text content (limited to stay within reasonable token limits)
+        article_text = self._article_excerpt(soup) if text is None else text
+        if not article_text:
+            # Nothing for the model to read (e.g. an image-only gallery page)
+            return None
 
-Respond in this exact format:
-Artist: [artist/creator name or "Unknown" if not found]
-Year: [year or "Unknown" if not found]
-Medium: [medium or "Unknown" if not found]
-Keywords: [comma-separated keywords, or "Unknown" if not found]
+        # The prompt is deterministic in (model, title, text), so reruns can reuse earlier answers
+        cache_path = None
+        if self.use_llm_cache:
+            key = hashlib.sha256(f"{LLM_MODEL}|{existing_metadata['title']}|{article_text}".encode()).hexdigest()
+            cache_path = self.llm_cache_dir / f'{key}.json'
+            if cache_path.exists():
+                print("    Using cached LLM result")
+                return orjson.loads(cache_path.read_bytes())
 
-Only include information that is explicitly stated in the text. Be concise."""
-                }]
-            )
+        try:
+            # Stream the reply so generation can be cut off as soon as every field is in
+            response_text = ''
+            with self._llm_semaphore:
+                with self.anthropic_client.messages.stream(
+                    model=LLM_MODEL,
+                    max_tokens=120,  # The four-line reply is ~60 tokens
+                    messages=[{
+                        "role": "user",
+                        "content": [
+                            {
+                                "type": "text",
+                                "text": LLM_METADATA_INSTRUCTIONS
+                            },
+                            {
+                                "type": "text",
+                                "text": f"Article title: {existing_metadata['title']}\nArticle text excerpt:\n{article_text}"
+                            }
+                        ]
+                    }]
+                ) as stream:
+                    for chunk in stream.text_stream:
+                        response_text += chunk
+                        # Keywords is the last field; stop once its line is complete
+                        keywords_at = response_text.find('Keywords:')
+                        if keywords_at != -1 and '\n' in response_text[keywords_at:]:
+                            break
 
             # Parse response
-            response_text = message.content[0].text
             result = {}
 
             # Extract artist
-            artist_match = re.search(r'Artist:\s*(.+?)(?:\n|$)', response_text)
+            artist_match = _ARTIST_RE.search(response_text)
             if artist_match and artist_match.group(1).strip() not in ['Unknown', 'unknown']:
                 result['author'] = artist_match.group(1).strip()
 
             # Extract year
-            year_match = re.search(r'Year:\s*(\d{4}|Unknown)', response_text)
+            year_match = _YEAR_LLM_RE.search(response_text)
             if year_match and year_match.group(1) != 'Unknown':
                 result['year'] = year_match.group(1)
 
             # Extract medium
-            medium_match = re.search(r'Medium:\s*(.+?)(?:\n|$)', response_text)
+            medium_match = _MEDIUM_RE.search(response_text)
             if medium_match and medium_match.group(1).strip() != 'Unknown':
                 result['medium'] = medium_match.group(1).strip()
 
             # Extract keywords
-            keywords_match = re.search(r'Keywords:\s*(.+?)(?:\n|$)', response_text, re.IGNORECASE)
+            keywords_match = _KEYWORDS_RE.search(response_text)
             if keywords_match and keywords_match.group(1).strip() not in ['Unknown', 'unknown']:
                 result['keywords'] = keywords_match.group(1).strip()
 
+            if cache_path:
+                self.llm_cache_dir.mkdir(exist_ok=True)
+                tmp_path = cache_path.with_suffix('.tmp')
+                tmp_path.write_bytes(orjson.dumps(result))
+                os.replace(tmp_path, cache_path)
+
             return result
 
         except Exception as e:
@@ -464,53 +1012,42 @@ Only include information that is explicitly stated in the text. Be concise."""
         Common formats:
         - "Artist, Title, Year medium"
         - "Artist, Title, medium, Year"
-        """
-        result = {}
 
+        Results are cached per caption text and returned read-only.
+        """
         if not caption_text:
-            return result
-
-        # Try to parse format: "Artist, Title, Year medium"
-        parts = [p.strip() for p in caption_text.split(',')]
-
-        if len(parts) >= 2:
-            # First part is likely artist name
-            result['artist'] = parts[0]
-
-            # Rest is title + possibly year/medium
-            title_and_more = ', '.join(parts[1:])
+            return _EMPTY_CAPTION
+        return _parse_caption(caption_text)
 
-            # Try to extract year (4 digits)
-            year_match = re.search(r'\b(1\d{3}|20\d{2})\b', title_and_more)
-            if year_match:
-                result['year'] = year_match.group(1)
-                # Remove year from title
-                title_and_more = title_and_more.replace(year_match.group(0), '').strip()
-
-            # What's left after removing year is likely title + medium
-            # Medium is usually the last word(s) after year
-            remaining = title_and_more.split(',')
-            if remaining:
-                result['title'] = remaining[0].strip()
-                if len(remaining) > 1:
-                    result['medium'] = remaining[-1].strip()
-            else:
-                result['title'] = title_and_more.strip()
-
-        return result
+    def _head_image(self, img_url):
+        """HEAD an image URL and return (reachable, Content-Length or None)"""
+        try:
+            head = self.session.head(img_url, timeout=5, allow_redirects=True)
+        except Exception:
+            return False, None
+        content_length = head.headers.get('content-length')
+        # Some servers refuse HEAD outright; let Slides try those with a GET
+        reachable = head.status_code < 400 or head.status_code == 405
+        return reachable, int(content_length) if content_length and content_length.isdigit() else None
 
     def _extract_socks_studio_data(self, url):
         """Extract metadata and images from a Socks Studio article"""
         print(f"\nProcessing: {url}")
 
         try:
+            self._article_pacer.wait(url)
             response = self.session.get(url, timeout=10)
             response.raise_for_status()
         except Exception as e:
             print(f"Error fetching article: {e}")
             return None
 
-        soup = BeautifulSoup(response.text, 'html.parser')
+        # Only build the parts of the page we read: JSON-LD, headings and the
+        # article body (figures + text for the LLM), skipping nav/sidebar/footer
+        soup = self._parse_html(response.content, _ARTICLE_STRAINER)
+        if not soup.find('article'):
+            # Unusual layout: fall back to the full page
+            soup = self._parse_html(response.content)
 
         # Extract metadata
         metadata = {
@@ -525,8 +1062,7 @@ Only include information that is explicitly stated in the text. Be concise."""
         json_ld_scripts = soup.find_all('script', type='application/ld+json')
         for script in json_ld_scripts:
             try:
-                import json
-                data = json.loads(script.string)
+                data = orjson.loads(script.encode_contents() or b'{}')
                 if isinstance(data, dict):
                     if 'author' in data:
                         if isinstance(data['author'], dict):
@@ -536,7 +1072,7 @@ Only include information that is explicitly stated in the text. Be concise."""
                     elif 'name' in data:
                         metadata['title'] = data['name']
                     if 'datePublished' in data:
-                        date_match = re.search(r'(\d{4})', data['datePublished'])
+                        date_match = _DATE_YEAR_RE.search(data['datePublished'])
                         if date_match:
                             metadata['year'] = date_match.group(1)
                     if 'keywords' in data:
@@ -560,6 +1096,8 @@ Only include information that is explicitly stated in the text. Be concise."""
         if content_div:
             # Look for figure elements (which contain img + figcaption)
             figures = content_div.find_all('figure')
+            candidates = []
+            seen = set()
             for figure in figures:
                 img = figure.find('img')
                 if not img:
@@ -570,32 +1108,50 @@ Only include information that is explicitly stated in the text. Be concise."""
                 if not img_url:
                     continue
 
-                img_url = urljoin(url, img_url)
+                img_url = self._fast_join(img_url, url)
 
                 # Filter tiny images
-                if 'icon' in img_url.lower() or 'logo' in img_url.lower():
+                if _BLOCKED_SUBSTR_RE.search(img_url):
                     continue
 
+                # Images whose width/height attributes pass the size filter are
+                # known to be real artwork; only the rest need a HEAD size check
+                needs_size_check = True
                 width = img.get('width')
                 height = img.get('height')
                 if width and height:
                     try:
                         if int(width) < 50 or int(height) < 50:
                             continue
+                        needs_size_check = False
                     except:
                         pass
 
                 if '-150x150' in img_url or '-300x' in img_url or 'thumbnail' in img_url:
                     continue
 
-                # Check if image is accessible and size
-                try:
-                    head = self.session.head(img_url, timeout=5, allow_redirects=True)
-                    content_length = head.headers.get('content-length')
-                    if content_length and int(content_length) < 5000:
-                        continue
-                except:
-                    pass
+                # Skip duplicates before they cost a HEAD request or caption parsing
+                if img_url in seen:
+                    continue
+                seen.add(img_url)
+
+                candidates.append((figure, img_url, needs_size_check))
+
+            # Check image sizes with concurrent HEAD requests (the loop is pure network latency)
+            check_urls = [img_url for _, img_url, needs_size_check in candidates if needs_size_check]
+            with ThreadPoolExecutor(max_workers=HEAD_CHECK_WORKERS) as executor:
+                heads = dict(zip(check_urls, executor.map(self._head_image, check_urls)))
+
+            # Collection-level fallbacks, fixed for the whole gallery
+            default_artist = metadata.get('author', 'Unknown')
+            default_title = metadata.get('title', 'Unknown')
+            default_year = metadata.get('year', 'Unknown')
+            default_medium = metadata.get('medium', 'Unknown')
+
+            for figure, img_url, _ in candidates:
+                head = heads.get(img_url)
+                if head and head[1] is not None and head[1] < 5000:
+                    continue
 
                 # Extract figcaption
                 figcaption = figure.find('figcaption')
@@ -606,35 +1162,30 @@ Only include information that is explicitly stated in the text. Be concise."""
                 artwork_metadata = self.parse_figcaption(caption_text, metadata)
 
                 # Use collection-level metadata as fallback when per-image data is missing
-                artist = artwork_metadata.get('artist') if artwork_metadata.get('artist') and artwork_metadata.get('artist') != 'Unknown' else metadata.get('author', 'Unknown')
-                title = artwork_metadata.get('title') if artwork_metadata.get('title') and artwork_metadata.get('title') != 'Unknown' else metadata.get('title', 'Unknown')
-                year = artwork_metadata.get('year') if artwork_metadata.get('year') and artwork_metadata.get('year') != 'Unknown' else metadata.get('year', 'Unknown')
-                medium = artwork_metadata.get('medium') if artwork_metadata.get('medium') and artwork_metadata.get('medium') != 'Unknown' else metadata.get('medium', 'Unknown')
+                artist = _fallback(artwork_metadata.get('artist'), default_artist)
+                title = _fallback(artwork_metadata.get('title'), default_title)
+                year = _fallback(artwork_metadata.get('year'), default_year)
+                medium = _fallback(artwork_metadata.get('medium'), default_medium)
 
-                images.append({
+                image = {
                     'url': img_url,
                     'caption': caption_text,
                     'artist': artist,
                     'title': title,
                     'year': year,
                     'medium': medium
-                })
-
-        # Remove duplicates while preserving order (based on URL)
-        seen = set()
-        unique_images = []
-        for img in images:
-            if img['url'] not in seen:
-                seen.add(img['url'])
-                unique_images.append(img)
-        images = unique_images
+                }
+                if head:
+                    image['reachable'] = head[0]  # Spares create_presentation a second HEAD
+                images.append(image)
 
         print(f"Found {len(images)} images")
 
         # Enhance metadata with LLM if author, year, medium is missing, or to extract keywords
         if self.anthropic_client and (metadata['author'] == 'Unknown' or metadata['year'] == 'Unknown' or metadata['medium'] == 'Unknown' or 'keywords' not in metadata):
             print("  Enhancing metadata with LLM...")
-            enhanced_metadata = self.enhance_metadata_with_llm(soup, metadata)
+            page_text = self._article_excerpt(soup)
+            enhanced_metadata = self.enhance_metadata_with_llm(soup, metadata, text=page_text)
             if enhanced_metadata:
                 if metadata['author'] == 'Unknown' and enhanced_metadata.get('author'):
                     metadata['author'] = enhanced_metadata['author']
@@ -668,13 +1219,14 @@ Only include information that is explicitly stated in the text. Be concise."""
         print(f"\nProcessing collection: {url}")
 
         try:
+            self._article_pacer.wait(url)
             response = self.session.get(url, timeout=10)
             response.raise_for_status()
         except Exception as e:
             print(f"Error fetching collection: {e}")
             return None
 
-        soup = BeautifulSoup(response.text, 'html.parser')
+        soup = self._parse_html(response.content)
 
         # Extract metadata
         metadata = {
@@ -689,7 +1241,7 @@ Only include information that is explicitly stated in the text. Be concise."""
         json_ld_scripts = soup.find_all('script', type='application/ld+json')
         for script in json_ld_scripts:
             try:
-                data = json.loads(script.string)
+                data = orjson.loads(script.encode_contents() or b'{}')
                 if isinstance(data, dict):
                     if 'headline' in data:
                         metadata['title'] = data['headline']
@@ -716,7 +1268,7 @@ Only include information that is explicitly stated in the text. Be concise."""
             # Pattern 1: Look for "Name's" possessive pattern
             # Match any sequence of words (including accented chars) followed by 's
             # Handle both straight (') and curly (') apostrophes
-            possessive_match = re.search(r"([A-ZÀ-ÿ][A-Za-zÀ-ÿ\s]+)['\u2019]s\s+", metadata['title'])
+            possessive_match = _POSSESSIVE_RE.search(metadata['title'])
             if possessive_match:
                 # Get the name before "'s"
                 potential_artist = possessive_match.group(1).strip()
@@ -732,12 +1284,18 @@ Only include information that is explicitly stated in the text. Be concise."""
 
         # Extract year from title (often in format "Title (ca. 1920s)" or "Title (1985)")
         if '(' in metadata['title'] and ')' in metadata['title']:
-            year_match = re.search(r'\(([^\)]*\d{4}[^\)]*)\)', metadata['title'])
+            year_match = _PAREN_YEAR_RE.search(metadata['title'])
             if year_match:
                 metadata['year'] = year_match.group(1)
 
-        # Find all images in the collection
-        images = []
+        # Set medium to 'Images' for PDR collections. Done before the gallery
+        # scan so images pick it up as their default medium directly.
+        if metadata['medium'] == 'Unknown':
+            metadata['medium'] = 'Images'
+
+        # Find all images in the collection, keyed by URL (dicts keep
+        # insertion order, so the first occurrence of a URL wins)
+        images_by_url = {}
 
         # PDR uses a gallery structure: <div class="collection__gallery">
         gallery = soup.find('div', class_='collection__gallery')
@@ -746,23 +1304,32 @@ Only include information that is explicitly stated in the text. Be concise."""
             # Find all img tags within the gallery
             img_tags = gallery.find_all('img')
 
+            # Collection-level fallbacks, fixed for the whole gallery
+            default_artist = metadata.get('author', 'Unknown')
+            default_title = metadata.get('title', '')
+            default_year = metadata.get('year', 'Unknown')
+            default_medium = metadata.get('medium', 'Unknown')
+
             for img in img_tags:
                 # Get image URL
                 img_url = img.get('src') or img.get('data-src')
                 if not img_url:
                     continue
 
-                img_url = urljoin(url, img_url)
+                img_url = self._fast_join(img_url, url)
 
                 # Filter tiny images
-                if 'icon' in img_url.lower() or 'logo' in img_url.lower():
+                if _BLOCKED_SUBSTR_RE.search(img_url):
                     continue
 
                 # Skip if URL contains width parameter < 200px
-                if 'width=' in img_url and re.search(r'width=(\d+)', img_url):
-                    width_match = re.search(r'width=(\d+)', img_url)
-                    if width_match and int(width_match.group(1)) < 200:
-                        continue
+                width_match = _WIDTH_RE.search(img_url)
+                if width_match and int(width_match.group(1)) < 200:
+                    continue
+
+                # Galleries often repeat thumbnails; skip before any caption work
+                if img_url in images_by_url:
+                    continue
 
                 # Try to find caption in parent button or nearby elements
                 # PDR structure: <button class="collection__gallery__image">
@@ -781,48 +1348,33 @@ Only include information that is explicitly stated in the text. Be concise."""
 
                 # For PDR, use collection-level metadata as fallback
                 # since individual images don't have detailed captions
-                artist = artwork_metadata.get('artist') if artwork_metadata.get('artist') and artwork_metadata.get('artist') != 'Unknown' else metadata.get('author', 'Unknown')
-                title = artwork_metadata.get('title') if artwork_metadata.get('title') and artwork_metadata.get('title') != 'Unknown' else metadata.get('title', '')
-                year = artwork_metadata.get('year') if artwork_metadata.get('year') and artwork_metadata.get('year') != 'Unknown' else metadata.get('year', 'Unknown')
-                medium = artwork_metadata.get('medium') if artwork_metadata.get('medium') and artwork_metadata.get('medium') != 'Unknown' else metadata.get('medium', 'Unknown')
+                artist = _fallback(artwork_metadata.get('artist'), default_artist)
+                title = _fallback(artwork_metadata.get('title'), default_title)
+                year = _fallback(artwork_metadata.get('year'), default_year)
+                medium = _fallback(artwork_metadata.get('medium'), default_medium)
 
-                images.append({
+                images_by_url[img_url] = {
                     'url': img_url,
                     'caption': caption_text,
                     'artist': artist,
                     'title': title,
                     'year': year,
                     'medium': medium
-                })
+                }
 
-        # Remove duplicates while preserving order
-        seen = set()
-        unique_images = []
-        for img in images:
-            if img['url'] not in seen:
-                seen.add(img['url'])
-                unique_images.append(img)
-        images = unique_images
+        images = list(images_by_url.values())
 
         print(f"Found {len(images)} images")
 
-        # Set medium to 'Images' for PDR collections
-        if metadata['medium'] == 'Unknown':
-            metadata['medium'] = 'Images'
-
         # Use LLM for keywords extraction if available
         if self.anthropic_client and 'keywords' not in metadata:
             print("  Extracting keywords with LLM...")
-            enhanced_metadata = self.enhance_metadata_with_llm(soup, metadata)
+            page_text = self._article_excerpt(soup)
+            enhanced_metadata = self.enhance_metadata_with_llm(soup, metadata, text=page_text)
             if enhanced_metadata and enhanced_metadata.get('keywords'):
                 metadata['keywords'] = enhanced_metadata['keywords']
                 print(f"    Found keywords: {metadata['keywords']}")
 
-        # Update image data with finalized metadata
-        for img in images:
-            if img['medium'] == 'Unknown' and metadata.get('medium') != 'Unknown':
-                img['medium'] = metadata['medium']
-
         return {
             'metadata': metadata,
             'images': images
@@ -837,8 +1389,112 @@ Only include information that is explicitly stated in the text. Be concise."""
         else:
             raise ValueError(f"Unknown site: {self.site}")
 
+    def _send_slide_requests(self, presentation_id, requests_list):
+        """Apply one window of slide requests to a presentation"""
+        request = self.slides_service.presentations().batchUpdate(
+            presentationId=presentation_id,
+            body={}
+        )
+        # googleapiclient serializes bodies with the stdlib json module; the request
+        # list is by far the largest payload we send, so encode it with orjson instead
+        request.body = orjson.dumps({'requests': requests_list})
+        request.body_size = len(request.body)
+        request.headers.pop('content-length', None)
+        _execute(request)
+
+    def _add_slides(self, presentation, metadata, images):
+        """Add one slide per image to a freshly created presentation"""
+        presentation_id = presentation['presentationId']
+
+        # Delete the default blank slide
+        requests_list = []
+        if presentation.get('slides'):
+            first_slide_id = presentation['slides'][0]['objectId']
+            requests_list.append({
+                'deleteObject': {
+                    'objectId': first_slide_id
+                }
+            })
+
+        # Paint the background once on the BLANK layout so every slide created
+        # from it inherits it, instead of one updatePageProperties per slide
+        blank_layout_id = next(
+            (layout['objectId'] for layout in presentation.get('layouts', [])
+             if layout.get('layoutProperties', {}).get('name') == 'BLANK'),
+            None
+        )
+        if blank_layout_id:
+            requests_list.append({'updatePageProperties': {'objectId': blank_layout_id, **_BLACK_BACKGROUND}})
+
+        # Link style is the same on every slide of this presentation
+        link_text_style = {
+            'fields': 'link,fontSize,foregroundColor',
+            'style': {'link': {'url': metadata['article_url']}, **_LINK_TEXT_STYLE},
+            'textRange': _ALL_TEXT
+        }
+
+        # Create slides for each image
+        for idx, img_data in enumerate(images):
+            slide_id = f'slide_{idx}'
+            image_id = f'image_{idx}'
+            textbox_id = f'textbox_{idx}'
+            link_id = f'link_{idx}'
+
+            # Caption uses per-image metadata (from figcaption) instead of article-level metadata:
+            # artist and title lines, then medium and year combined on one line
+            meta_line = ', '.join(filter(None, (_fallback(img_data['medium'], None),
+                                                _fallback(img_data['year'], None))))
+            caption_text = '\n'.join(filter(None, (_fallback(img_data['artist'], None),
+                                                   _fallback(img_data['title'], None),
+                                                   meta_line))) or 'Untitled'
+
+            # Queue all of this slide's requests with a single extend; only
+            # ids, the image URL and the caption vary, the rest is shared
+            requests_list.extend((
+                {'createSlide': {'objectId': slide_id, 'slideLayoutReference': _BLANK_LAYOUT}},
+                # Slides fetches the image server-side from its public URL,
+                # so the image bytes never pass through this process
+                {'createImage': {
+                    'objectId': image_id,
+                    'url': img_data['url'],
+                    'elementProperties': {'pageObjectId': slide_id, **_IMAGE_BOX}
+                }},
+                {'createShape': {
+                    'objectId': textbox_id,
+                    'shapeType': 'TEXT_BOX',
+                    'elementProperties': {'pageObjectId': slide_id, **_CAPTION_BOX}
+                }},
+                {'insertText': {'objectId': textbox_id, 'text': caption_text}},
+                {'updateTextStyle': {'objectId': textbox_id, **_CAPTION_TEXT_STYLE}},
+                {'updateShapeProperties': {'objectId': textbox_id, **_ALIGN_BOTTOM}},
+                {'createShape': {
+                    'objectId': link_id,
+                    'shapeType': 'TEXT_BOX',
+                    'elementProperties': {'pageObjectId': slide_id, **_LINK_BOX}
+                }},
+                {'insertText': {'objectId': link_id, 'text': 'Socks-studio'}},
+                {'updateTextStyle': {'objectId': link_id, **link_text_style}},
+                {'updateParagraphStyle': {'objectId': link_id, **_ALIGN_END}},
+                {'updateShapeProperties': {'objectId': link_id, **_ALIGN_BOTTOM}}
+            ))
+            if not blank_layout_id:
+                # No BLANK layout to inherit from; set the background per slide
+                requests_list.append({'updatePageProperties': {'objectId': slide_id, **_BLACK_BACKGROUND}})
+
+            # Send a full window and start the next one
+            if (idx + 1) % SLIDES_PER_BATCH_UPDATE == 0:
+                self._send_slide_requests(presentation_id, requests_list)
+                requests_list = []
+                print(f"  Added {idx + 1}/{len(images)} slides")
+
+        # Execute remaining requests
+        if requests_list:
+            self._send_slide_requests(presentation_id, requests_list)
+
     def create_presentation(self, article_data):
         """Create a Google Slides presentation for an article"""
+        from googleapiclient.errors import HttpError
+
         metadata = article_data['metadata']
         images = article_data['images']
 
@@ -846,273 +1502,46 @@ Only include information that is explicitly stated in the text. Be concise."""
             print("No images to create slides from")
             return None
 
+        # Slides fetches each image itself, and one broken URL fails the whole
+        # batchUpdate, so drop unreachable images first. Only images that weren't
+        # already HEAD'd during extraction are checked (concurrently, it's all latency)
+        unchecked = [img for img in images if 'reachable' not in img]
+        with ThreadPoolExecutor(max_workers=HEAD_CHECK_WORKERS) as executor:
+            for img, (ok, _) in zip(unchecked, executor.map(self._head_image, [img['url'] for img in unchecked])):
+                img['reachable'] = ok
+        reachable = [img['reachable'] for img in images]
+        if not all(reachable):
+            print(f"Skipping {reachable.count(False)} unreachable image(s)")
+            images = [img for img, ok in zip(images, reachable) if ok]
+            article_data['images'] = images  # Keep slide counts in tracking/catalog accurate
+            if not images:
+                print("No reachable images to create slides from")
+                return None
+
         # Create presentation
         presentation_title = metadata['title'][:100]  # Limit title length
         print(f"\nCreating presentation: {presentation_title}")
 
         try:
-            presentation = self.slides_service.presentations().create(
+            presentation = _execute_create(self.slides_service.presentations().create(
                 body={'title': presentation_title}
-            ).execute()
+            ))
 
             presentation_id = presentation['presentationId']
             print(f"✓ Created presentation ID: {presentation_id}")
             print(f"  URL: https://docs.google.com/presentation/d/{presentation_id}")
 
-            # Delete the default blank slide
-            requests_list = []
-            if presentation.get('slides'):
-                first_slide_id = presentation['slides'][0]['objectId']
-                requests_list.append({
-                    'deleteObject': {
-                        'objectId': first_slide_id
-                    }
-                })
-
-            # Create slides for each image
-            for idx, img_data in enumerate(images):
-                print(f"  Adding slide {idx + 1}/{len(images)}...")
-
-                # Create slide
-                slide_id = f'slide_{idx}'
-                requests_list.append({
-                    'createSlide': {
-                        'objectId': slide_id,
-                        'slideLayoutReference': {
-                            'predefinedLayout': 'BLANK'
-                        }
-                    }
-                })
-
-                # Set black background
-                requests_list.append({
-                    'updatePageProperties': {
-                        'objectId': slide_id,
-                        'fields': 'pageBackgroundFill',
-                        'pageProperties': {
-                            'pageBackgroundFill': {
-                                'solidFill': {
-                                    'color': {
-                                        'rgbColor': {
-                                            'red': 0.0,
-                                            'green': 0.0,
-                                            'blue': 0.0
-                                        }
-                                    }
-                                }
-                            }
-                        }
-                    }
-                })
-
-                # Add image centered at top (no spacing)
-                # Slide: 10" x 5.625" (9144000 x 5143500 EMU) - Widescreen 16:9
-                # Reserve 0.6" for caption at bottom
-                # Available height: 5.625" - 0.6" = 5.025"
-                # Image box: 9" wide x 5.025" tall (allows landscape images to extend)
-                # Portrait images will be constrained by height and centered within
-                # Landscape images will use more width with height at 5.025"
-                # Centered horizontally: (10" - 9") / 2 = 0.5" = 457200 EMU
-                image_id = f'image_{idx}'
-                requests_list.append({
-                    'createImage': {
-                        'objectId': image_id,
-                        'url': img_data['url'],
-                        'elementProperties': {
-                            'pageObjectId': slide_id,
-                            'size': {
-                                'width': {'magnitude': 8229600, 'unit': 'EMU'},   # 9" wide (allows landscape)
-                                'height': {'magnitude': 4594860, 'unit': 'EMU'}   # 5.025" height constraint
-                            },
-                            'transform': {
-                                'scaleX': 1,
-                                'scaleY': 1,
-                                'translateX': 457200,  # Center horizontally: 0.5" from edge
-                                'translateY': 0,       # Top of slide (no spacing)
-                                'unit': 'EMU'
-                            }
-                        }
-                    }
-                })
-
-                # Add caption text box (aligned to bottom of slide)
-                # Use per-image metadata (from figcaption) instead of article-level metadata
-                textbox_id = f'textbox_{idx}'
-                caption_parts = []
-                if img_data['artist'] and img_data['artist'] != 'Unknown':
-                    caption_parts.append(img_data['artist'])
-                if img_data['title'] and img_data['title'] != 'Unknown':
-                    caption_parts.append(img_data['title'])
-
-                # Combine medium and year on same line if both exist
-                meta_line = []
-                if img_data['medium'] and img_data['medium'] != 'Unknown':
-                    meta_line.append(img_data['medium'])
-                if img_data['year'] and img_data['year'] != 'Unknown':
-                    meta_line.append(img_data['year'])
-                if meta_line:
-                    caption_parts.append(', '.join(meta_line))
-
-                caption_text = '\n'.join(caption_parts) if caption_parts else 'Untitled'
-
-                # Caption box directly below image (no spacing)
-                # Position Y: 5.025" (directly after image) = 4594860 EMU
-                # Width: 7.5" (leave room for link on right)
-                # Height: 0.6" (548640 EMU)
-                requests_list.append({
-                    'createShape': {
-                        'objectId': textbox_id,
-                        'shapeType': 'TEXT_BOX',
-                        'elementProperties': {
-                            'pageObjectId': slide_id,
-                            'size': {
-                                'width': {'magnitude': 6858000, 'unit': 'EMU'},   # 7.5" (leave room for link)
-                                'height': {'magnitude': 548640, 'unit': 'EMU'}    # 0.6"
-                            },
-                            'transform': {
-                                'scaleX': 1,
-                                'scaleY': 1,
-                                'translateX': 0,          # No left margin
-                                'translateY': 4594860,    # Directly below 5.025" image
-                                'unit': 'EMU'
-                            }
-                        }
-                    }
-                })
-
-                # Insert caption text
-                requests_list.append({
-                    'insertText': {
-                        'objectId': textbox_id,
-                        'text': caption_text
-                    }
-                })
-
-                # Style the caption text (9pt font, light gray on black)
-                requests_list.append({
-                    'updateTextStyle': {
-                        'objectId': textbox_id,
-                        'fields': 'fontSize,foregroundColor',
-                        'style': {
-                            'fontSize': {
-                                'magnitude': 9,
-                                'unit': 'PT'
-                            },
-                            'foregroundColor': {
-                                'opaqueColor': {
-                                    'rgbColor': {
-                                        'red': 0.85,
-                                        'green': 0.85,
-                                        'blue': 0.85
-                                    }
-                                }
-                            }
-                        },
-                        'textRange': {'type': 'ALL'}
-                    }
-                })
-
-                # Align caption text to bottom of text box
-                requests_list.append({
-                    'updateShapeProperties': {
-                        'objectId': textbox_id,
-                        'fields': 'contentAlignment',
-                        'shapeProperties': {
-                            'contentAlignment': 'BOTTOM'
-                        }
-                    }
-                })
-
-                # Add link to Socks-studio (right side, aligned with caption)
-                # Position X: 7.5" (right of caption box) = 6858000 EMU
-                # Position Y: 5.025" (aligned with caption) = 4594860 EMU
-                # Width: 2.5" (remaining space to right edge at 10")
-                # Height: 0.6" = 548640 EMU
-                link_id = f'link_{idx}'
-                requests_list.append({
-                    'createShape': {
-                        'objectId': link_id,
-                        'shapeType': 'TEXT_BOX',
-                        'elementProperties': {
-                            'pageObjectId': slide_id,
-                            'size': {
-                                'width': {'magnitude': 2286000, 'unit': 'EMU'},   # 2.5"
-                                'height': {'magnitude': 548640, 'unit': 'EMU'}    # Match caption height (0.6")
-                            },
-                            'transform': {
-                                'scaleX': 1,
-                                'scaleY': 1,
-                                'translateX': 6858000,  # 7.5" from left (after caption box)
-                                'translateY': 4594860,  # Align with caption
-                                'unit': 'EMU'
-                            }
-                        }
-                    }
-                })
-
-                requests_list.append({
-                    'insertText': {
-                        'objectId': link_id,
-                        'text': 'Socks-studio'
-                    }
-                })
-
-                # Style and add hyperlink (9pt font, dark gray on black)
-                requests_list.append({
-                    'updateTextStyle': {
-                        'objectId': link_id,
-                        'fields': 'link,fontSize,foregroundColor',
-                        'style': {
-                            'link': {
-                                'url': metadata['article_url']
-                            },
-                            'fontSize': {
-                                'magnitude': 9,
-                                'unit': 'PT'
-                            },
-                            'foregroundColor': {
-                                'opaqueColor': {
-                                    'rgbColor': {
-                                        'red': 0.6,
-                                        'green': 0.6,
-                                        'blue': 0.6
-                                    }
-                                }
-                            }
-                        },
-                        'textRange': {'type': 'ALL'}
-                    }
-                })
-
-                # Right-align the link text
-                requests_list.append({
-                    'updateParagraphStyle': {
-                        'objectId': link_id,
-                        'fields': 'alignment',
-                        'style': {
-                            'alignment': 'END'
-                        },
-                        'textRange': {'type': 'ALL'}
-                    }
-                })
-
-                # Align link text to bottom of text box
-                requests_list.append({
-                    'updateShapeProperties': {
-                        'objectId': link_id,
-                        'fields': 'contentAlignment',
-                        'shapeProperties': {
-                            'contentAlignment': 'BOTTOM'
-                        }
-                    }
-                })
-
-            # Execute all requests
-            if requests_list:
-                self.slides_service.presentations().batchUpdate(
-                    presentationId=presentation_id,
-                    body={'requests': requests_list}
-                ).execute()
+            # A failure in a later window would leave a half-built deck behind,
+            # so delete the presentation before passing the error on
+            try:
+                self._add_slides(presentation, metadata, images)
+            except Exception:
+                try:
+                    _execute(self.drive_service.files().delete(fileId=presentation_id))
+                    print(f"  Deleted incomplete presentation {presentation_id}")
+                except Exception as error:
+                    print(f"  Could not delete incomplete presentation {presentation_id}: {error}")
+                raise
 
             print(f"✓ Successfully created {len(images)} slides!")
             return presentation_id
@@ -1187,7 +1616,7 @@ Only include information that is explicitly stated in the text. Be concise."""
             url: Article or collection URL to process
 
         Returns:
-            dict with presentation data, or raises Exception on error
+            PresentationRecord, or raises Exception on error
         """
         # Extract article data
         article_data = self.extract_article_data(url)
@@ -1201,24 +1630,26 @@ Only include information that is explicitly stated in the text. Be concise."""
         if not presentation_id:
             raise Exception(f"Failed to create presentation for {url}")
 
-        # Move to folder
+        # Queue the move to the folder (sent in bulk by flush())
         if self.drive_folder_id:
-            self.move_presentation_to_folder(presentation_id, self.drive_folder_id)
+            with self._write_lock:
+                self._pending_moves.append(presentation_id)
 
         presentation_url = f"https://docs.google.com/presentation/d/{presentation_id}"
 
         # Prepare presentation data for tracking/catalog
-        presentation_data = {
-            'presentation_id': presentation_id,
-            'presentation_url': presentation_url,
-            'title': article_data['metadata']['title'],
-            'author': article_data['metadata'].get('author', 'Unknown'),
-            'year': article_data['metadata'].get('year', 'Unknown'),
-            'medium': article_data['metadata'].get('medium', 'Unknown'),
-            'keywords': article_data['metadata'].get('keywords', ''),
-            'slide_count': len(article_data['images']),
-            'processed_date': datetime.now().isoformat()
-        }
+        metadata = article_data['metadata']
+        presentation_data = PresentationRecord(
+            presentation_id=presentation_id,
+            presentation_url=presentation_url,
+            title=metadata['title'],
+            author=metadata.get('author', 'Unknown'),
+            year=metadata.get('year', 'Unknown'),
+            medium=metadata.get('medium', 'Unknown'),
+            keywords=metadata.get('keywords', ''),
+            slide_count=len(article_data['images']),
+            processed_date=datetime.now().isoformat()
+        )
 
         # Save to tracking file
         self.save_processed_article(url, presentation_data)
@@ -1229,6 +1660,17 @@ Only include information that is explicitly stated in the text. Be concise."""
 
         return presentation_data
 
+    def _process_one_article(self, article_url):
+        """Process one article for run_batch, returning None instead of raising on failure"""
+        try:
+            presentation_data = self.process_article(article_url)
+        except Exception as e:
+            print(f"Error processing {article_url}: {e}")
+            return None
+
+        print(f"✓ Presentation created: {presentation_data.presentation_url}")
+        return presentation_data
+
     def run_batch(self, count=1):
         """Run in batch mode - process N articles without prompting"""
         print("="*60)
@@ -1251,67 +1693,55 @@ Only include information that is explicitly stated in the text. Be concise."""
         print(f"Catalog URL: {catalog_url}")
 
         # Get article URLs (most recent first)
-        # Fetch incrementally until we have enough unprocessed articles
+        # Listing pages are fetched lazily, only until we have enough unprocessed articles
         print("\nFetching article URLs...")
         article_urls = []
-        fetched_count = 0
         skipped_already_processed = 0
-        batch_size = 50  # Fetch in batches of 50
-
-        while len(article_urls) < count:
-            # Fetch next batch
-            fetch_limit = fetched_count + batch_size
-            all_urls = self.get_article_urls(limit=fetch_limit)
+        # Read the tracking file once up front; the dict stays current as articles are saved
+        processed = self.load_processed_articles()
 
-            # Check if we've fetched all available articles
-            if len(all_urls) == fetched_count:
-                print(f"Reached end of available articles")
+        for url in self.iter_article_urls(count):
+            if url in processed:
+                skipped_already_processed += 1
+                continue
+            article_urls.append(url)
+            if len(article_urls) >= count:
                 break
-
-            # Process newly fetched URLs
-            new_urls = all_urls[fetched_count:]
-            for url in new_urls:
-                if not self.is_article_processed(url):
-                    article_urls.append(url)
-                    if len(article_urls) >= count:
-                        break
-                else:
-                    skipped_already_processed += 1
-
-            fetched_count = len(all_urls)
-            print(f"  Fetched {fetched_count} articles, found {len(article_urls)} unprocessed...")
+        else:
+            print(f"Reached end of available articles")
 
         print(f"Already processed: {skipped_already_processed}")
         print(f"Will process: {len(article_urls)} new article(s)")
 
-        # Process articles
+        # Process articles concurrently; each one is independent and mostly waiting on the network
+        print(f"\nProcessing with up to {ARTICLE_WORKERS} articles in parallel...")
         created_presentations = []
         skipped_count = 0
-        for i, article_url in enumerate(article_urls, 1):
-            print(f"\n{'='*60}")
-            print(f"Article {i}/{len(article_urls)}")
-            print(f"{'='*60}")
-
-            try:
-                presentation_data = self.process_article(article_url)
-
-                created_presentations.append({
-                    'title': presentation_data['title'],
-                    'url': presentation_data['presentation_url'],
-                    'slides': presentation_data['slide_count'],
-                    'keywords': presentation_data.get('keywords', '')
-                })
-
-                print(f"\n{'='*60}")
-                print("Presentation created successfully!")
-                print(f"View at: {presentation_data['presentation_url']}")
-                print(f"{'='*60}")
-
-            except Exception as e:
-                print(f"Error processing article: {e}")
-                skipped_count += 1
-
-            time.sleep(1)  # Be respectful to APIs
+        try:
+            with ThreadPoolExecutor(max_workers=ARTICLE_WORKERS) as executor:
+                futures = [executor.submit(self._process_one_article, url) for url in article_urls]
+                try:
+                    # Collect results as they finish rather than in submission order
+                    for future in as_completed(futures):
+                        presentation_data = future.result()
+                        if presentation_data is None:
+                            skipped_count += 1
+                            continue
+                        created_presentations.append({
+                            'title': presentation_data.title,
+                            'url': presentation_data.presentation_url,
+                            'slides': presentation_data.slide_count,
+                            'keywords': presentation_data.keywords
+                        })
+                        print(f"  Completed {len(created_presentations) + skipped_count}/{len(article_urls)}")
+                except BaseException:
+                    # On Ctrl-C (or any error) drop the queued articles and only wait
+                    # for the ones already running, instead of finishing the whole batch
+                    executor.shutdown(wait=True, cancel_futures=True)
+                    raise
+        finally:
+            # Send any queued folder moves and catalog rows, even if a run is interrupted
+            self.flush()
 
         # Summary
         print(f"\n{'='*60}")
@@ -1352,8 +1782,13 @@ if __name__ == "__main__":
         default='socks-studio',
         help='Website to scrape (default: socks-studio)'
     )
+    parser.add_argument(
+        '--no-llm-cache',
+        action='store_true',
+        help='Always call the LLM instead of reusing cached results'
+    )
 
     args = parser.parse_args()
 
-    creator = SocksStudioSlidesCreator(site=args.site)
+    creator = SocksStudioSlidesCreator(site=args.site, use_llm_cache=not args.no_llm_cache)
     creator.run_batch(count=args.count)
@@ -4,17 +4,103 @@ Scraper for socks-studio.com
 Downloads all images with metadata: Author, Title, Medium, Year, and source links
 """
 
-import sys
+import atexit
+import asyncio
+import time
+import aiohttp
 import requests
-from bs4 import BeautifulSoup
-import json
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from concurrent.futures import ThreadPoolExecutor
+from selectolax.parser import HTMLParser
+from lxml import etree
+import orjson
 import csv
-import os
-import time
+import posixpath
 import re
-from urllib.parse import urljoin, urlparse
+import hashlib
+import shutil
+from enum import Enum
+from urllib.parse import urljoin, urlparse, urlunparse
 from pathlib import Path
 
+# Page requests (listing pages and articles) in flight at once
+PAGE_CONCURRENCY = 8
+# Page requests are paced by a token bucket: on average PAGE_RATE per second,
+# with bursts of up to PAGE_BURST when the server has been idle
+PAGE_RATE = 1.0
+PAGE_BURST = 3
+# Image downloads running at once (threads sharing the requests session)
+DOWNLOAD_WORKERS = 8
+# Files smaller than this (5KB) are likely icons or spacers, not artwork
+MIN_IMAGE_BYTES = 5000
+# Read/write block size when saving images
+COPY_BUFFER_SIZE = 1 << 20
+# Columns of metadata.csv, in the order image dicts are filled in
+CSV_FIELDS = ['image_url', 'author', 'title', 'medium', 'year', 'article_url',
+              'local_filename', 'file_size_bytes']
+
+_YEAR_RE = re.compile(r'(\d{4})')
+# Characters dropped from titles, and runs of dashes/spaces collapsed to '_', in filenames
+_FN_STRIP_RE = re.compile(r'[^\w\s-]')
+_FN_COLLAPSE_RE = re.compile(r'[-\s]+')
+# Icons/logos (any case) and WordPress thumbnail sizes, checked in one pass over the URL
+_SKIP_IMAGE_RE = re.compile(r'(?i:icon|logo)|-150x150|-300x|thumbnail')
+# Schema.org types whose JSON-LD holds article metadata (also matches NewsArticle etc.)
+_ARTICLE_SCHEMA_TYPES = ('Article', 'BlogPosting', 'CreativeWork')
+_SITEMAP_LOC = '{http://www.sitemaps.org/schemas/sitemap/0.9}loc'
+
+
+class DownloadStatus(Enum):
+    """Outcome of download_image()"""
+    DOWNLOADED = 'downloaded'
+    ALREADY_DOWNLOADED = 'already downloaded'  # Saved and recorded by an earlier run
+    SKIPPED = 'skipped'  # Too small to be artwork
+    FAILED = 'failed'
+
+
+def _canonical_image_url(img_url):
+    """Key for spotting the same image under different URLs (host case, query strings)"""
+    parsed = urlparse(img_url)
+    return urlunparse((parsed.scheme, parsed.netloc.lower(), parsed.path, '', '', ''))
+
+
+class RateLimiter:
+    """Token bucket allowing `burst` requests at once and `rate` per second on average
+
+    Callers only wait when the bucket is empty, so fast responses aren't padded
+    with a fixed sleep.
+    """
+
+    def __init__(self, rate=1.0, burst=3):
+        self.rate = rate
+        self.burst = burst
+        self._tokens = burst
+        self._last = time.monotonic()
+
+    async def acquire(self):
+        """Take a token, waiting for the bucket to refill if it is empty"""
+        now = time.monotonic()
+        self._tokens = min(self.burst, self._tokens + (now - self._last) * self.rate)
+        self._last = now
+        self._tokens -= 1
+        # A negative balance is a token borrowed from the future; wait until it has refilled
+        if self._tokens < 0:
+            await asyncio.sleep(-self._tokens / self.rate)
+
+
+def _image_source(attrs):
+    """URL of an <img>, including lazy-loaded images whose src is only a placeholder
+
+    Tries src, data-src, data-lazy-src, then the first srcset candidate,
+    skipping inline data: URIs used as lazy-load placeholders.
+    """
+    srcset_tokens = (attrs.get('srcset') or '').replace(',', ' ').split()
+    candidates = (attrs.get('src'), attrs.get('data-src'), attrs.get('data-lazy-src'),
+                  srcset_tokens[0] if srcset_tokens else None)
+    return next((src for src in candidates if src and not src.startswith('data:')), None)
+
+
 class SocksStudioScraper:
     def __init__(self, output_dir="socks_studio_images"):
         self.base_url = "https://socks-studio.com"
@@ -23,73 +109,188 @@ class SocksStudioScraper:
         self.images_dir.mkdir(parents=True, exist_ok=True)
         self.session = requests.Session()
         self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'
+            'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36',
+            'Accept-Encoding': 'br, gzip, deflate'
         })
+        # Keep-alive pool sized so download threads don't queue for a connection,
+        # with automatic retries on transient errors
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=32,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.5,
+                status_forcelist=(429, 500, 502, 503, 504),
+                allowed_methods=frozenset(['GET', 'HEAD'])
+            )
+        )
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        self.pool = ThreadPoolExecutor(max_workers=DOWNLOAD_WORKERS)
         self.metadata = []
-
-    def get_all_article_urls(self):
-        """Scrape all pages to collect article URLs"""
-        print("Collecting article URLs from all pages...", flush=True)
-        article_urls = []
-
-        # Start with page 1
-        page = 1
-        while True:
-            if page == 1:
-                url = self.base_url
-            else:
-                url = f"{self.base_url}/page/{page}/"
-
-            print(f"Scraping page {page}...", flush=True)
+        self._seen_urls = set()  # Canonical URLs of images already queued this run
+
+        # Per-image metadata is appended to a JSON Lines file as images finish;
+        # metadata.json is rebuilt from it once at the end of the run
+        self.jsonl_path = self.output_dir / "metadata.jsonl"
+        self.json_path = self.output_dir / "metadata.json"
+        if not self.jsonl_path.exists() and self.json_path.exists():
+            self._migrate_metadata_json()
+        self._jsonl = open(self.jsonl_path, 'ab', buffering=1 << 16)
+
+        # One CSV writer for the whole run instead of reopening the file per image
+        self.csv_path = self.output_dir / "metadata.csv"
+        self._csv_file = open(self.csv_path, 'a', newline='', encoding='utf-8', buffering=1 << 15)
+        self._csv_writer = csv.DictWriter(self._csv_file, fieldnames=CSV_FIELDS)
+        if self._csv_file.tell() == 0:
+            self._csv_writer.writeheader()
+        # Flush buffered rows even if the run stops early
+        atexit.register(self._close_outputs)
+        self._page_semaphore = None  # Created in _run, on the loop that uses it
+        self.limiter = RateLimiter(rate=PAGE_RATE, burst=PAGE_BURST)
+
+    async def _fetch_page(self, http, url):
+        """GET a page over the shared aiohttp session, returning its body or None on error"""
+        async with self._page_semaphore:
+            await self.limiter.acquire()
             try:
-                response = self.session.get(url, timeout=10)
-                response.raise_for_status()
+                async with http.get(url) as response:
+                    response.raise_for_status()
+                    return await response.read()
             except Exception as e:
-                print(f"Error fetching page {page}: {e}", flush=True)
-                break
+                print(f"Error fetching {url}: {e}", flush=True)
+                return None
+
+    def _extract_listing_links(self, html):
+        """Article links on a listing page, or None if the page has no articles"""
+        tree = HTMLParser(html)
+
+        # Find article links (looking for blog post titles)
+        articles = tree.css('article')
+        if not articles:
+            return None
+
+        links = []
+        for article in articles:
+            # Find h2 with a link inside
+            h2 = article.css_first('h2')
+            if h2:
+                link = h2.css_first('a')
+                href = link.attributes.get('href') if link else None
+                if href:
+                    links.append(urljoin(self.base_url, href))
+        return links
+
+    async def _get_urls_from_rest_api(self, http):
+        """Post URLs from the WordPress REST API (newest first), or None if unavailable"""
+        api_url = f"{self.base_url}/wp-json/wp/v2/posts?per_page=100&_fields=link"
+        try:
+            await self.limiter.acquire()
+            async with http.get(f"{api_url}&page=1") as response:
+                if response.status != 200:
+                    return None
+                total_pages = int(response.headers.get('X-WP-TotalPages', 1))
+                bodies = [await response.read()]
+        except Exception as e:
+            print(f"REST API unavailable: {e}", flush=True)
+            return None
 
-            soup = BeautifulSoup(response.text, 'html.parser')
+        # The first response says how many pages there are; fetch the rest at once
+        bodies += await asyncio.gather(*(self._fetch_page(http, f"{api_url}&page={page}")
+                                         for page in range(2, total_pages + 1)))
+        if any(body is None for body in bodies):
+            return None
 
-            # Find article links (looking for blog post titles)
-            articles = soup.find_all('article')
-            if not articles:
-                print(f"No more articles found on page {page}", flush=True)
-                break
+        try:
+            return [post['link'] for body in bodies for post in orjson.loads(body)]
+        except (orjson.JSONDecodeError, KeyError, TypeError):
+            return None
 
-            for article in articles:
-                # Find h2 with a link inside
-                h2 = article.find('h2')
-                if h2:
-                    link = h2.find('a')
-                    if link and link.get('href'):
-                        article_url = urljoin(self.base_url, link['href'])
-                        if article_url not in article_urls:
-                            article_urls.append(article_url)
-
-            print(f"Found {len(articles)} articles on page {page}", flush=True)
-            page += 1
-            time.sleep(1)  # Be respectful to the server
-
-            # Safety limit
-            if page > 50:
-                print(f"Reached safety limit at page {page}", flush=True)
-                break
+    async def _get_urls_from_sitemap(self, http):
+        """Post URLs from the WordPress core sitemaps, or None if unavailable"""
+        index = await self._fetch_page(http, f"{self.base_url}/wp-sitemap.xml")
+        if index is None:
+            return None
 
+        try:
+            sitemap_urls = [loc.text.strip() for loc in etree.fromstring(index).iter(_SITEMAP_LOC)
+                            if loc.text and 'posts-post' in loc.text]
+        except etree.XMLSyntaxError:
+            return None
+        if not sitemap_urls:
+            return None
+
+        urls = []
+        for body in await asyncio.gather(*(self._fetch_page(http, url) for url in sitemap_urls)):
+            if body is None:
+                return None
+            try:
+                urls.extend(loc.text.strip() for loc in etree.fromstring(body).iter(_SITEMAP_LOC) if loc.text)
+            except etree.XMLSyntaxError:
+                return None
+        return urls
+
+    async def get_all_article_urls(self, http):
+        """Collect article URLs, preferring WordPress's own indexes over crawling listing pages
+
+        The REST API and sitemaps list every post in a handful of requests; the
+        paginated listing crawl is only used when neither is available.
+        """
+        print("Collecting article URLs...", flush=True)
+        for source, discover in (("REST API", self._get_urls_from_rest_api),
+                                 ("sitemap", self._get_urls_from_sitemap)):
+            urls = await discover(http)
+            if urls:
+                article_urls = list(dict.fromkeys(urls))
+                print(f"Found {len(article_urls)} articles via the {source}", flush=True)
+                return article_urls
+
+        return await self._crawl_listing_pages(http)
+
+    async def _crawl_listing_pages(self, http):
+        """Scrape all listing pages to collect article URLs"""
+        print("Collecting article URLs from all pages...", flush=True)
+        article_urls = []
+        seen = set()
+
+        max_pages = 50  # Safety limit
+        # Fetch listing pages in concurrent waves; stop at the first failed or empty page
+        for wave_start in range(1, max_pages + 1, PAGE_CONCURRENCY):
+            pages = range(wave_start, min(wave_start + PAGE_CONCURRENCY, max_pages + 1))
+            urls = [self.base_url if page == 1 else f"{self.base_url}/page/{page}/" for page in pages]
+            print(f"Scraping pages {pages[0]}-{pages[-1]}...", flush=True)
+            bodies = await asyncio.gather(*(self._fetch_page(http, url) for url in urls))
+
+            for page, body in zip(pages, bodies):
+                links = self._extract_listing_links(body) if body is not None else None
+                if links is None:
+                    print(f"No more articles found on page {page}", flush=True)
+                    print(f"\nTotal articles found: {len(article_urls)}", flush=True)
+                    return article_urls
+
+                for article_url in links:
+                    if article_url not in seen:
+                        seen.add(article_url)
+                        article_urls.append(article_url)
+                print(f"Found {len(links)} articles on page {page}", flush=True)
+
+        print(f"Reached safety limit at page {max_pages}", flush=True)
         print(f"\nTotal articles found: {len(article_urls)}", flush=True)
         return article_urls
 
-    def extract_metadata_from_article(self, url):
+    async def extract_metadata_from_article(self, http, url):
         """Extract metadata and images from a single article"""
         print(f"\nProcessing: {url}", flush=True)
 
-        try:
-            response = self.session.get(url, timeout=10)
-            response.raise_for_status()
-        except Exception as e:
-            print(f"Error fetching article: {e}")
+        html = await self._fetch_page(http, url)
+        if html is None:
             return []
+        return self._parse_article(url, html)
 
-        soup = BeautifulSoup(response.text, 'html.parser')
+    def _parse_article(self, url, html):
+        """Metadata and image list for one downloaded article page"""
+        # selectolax's C parser; we only need a handful of CSS lookups per page
+        tree = HTMLParser(html)
 
         # Extract metadata from JSON-LD
         metadata = {
@@ -101,10 +302,15 @@ class SocksStudioScraper:
         }
 
         # Try to find JSON-LD schema
-        json_ld_scripts = soup.find_all('script', type='application/ld+json')
+        json_ld_scripts = tree.css('script[type="application/ld+json"]')
         for script in json_ld_scripts:
+            text = script.text()
+            # Only article-like schemas carry the fields we want; skip parsing
+            # WebSite/BreadcrumbList/ImageObject blobs with a cheap substring test
+            if not any(schema_type in text for schema_type in _ARTICLE_SCHEMA_TYPES):
+                continue
             try:
-                data = json.loads(script.string)
+                data = orjson.loads(text)
                 if isinstance(data, dict):
                     # Extract author
                     if 'author' in data:
@@ -121,63 +327,60 @@ class SocksStudioScraper:
 
                     # Extract date (year)
                     if 'datePublished' in data:
-                        date_match = re.search(r'(\d{4})', data['datePublished'])
+                        date_match = _YEAR_RE.search(data['datePublished'])
                         if date_match:
                             metadata['year'] = date_match.group(1)
 
                     # Extract keywords/medium
                     if 'keywords' in data:
                         metadata['medium'] = data['keywords']
-            except json.JSONDecodeError:
-                pass
+            except orjson.JSONDecodeError:
+                continue
+
+            # Stop once every field is filled; later schema blocks can't add anything
+            if all(metadata[key] != 'Unknown' for key in ('author', 'title', 'year', 'medium')):
+                break
 
         # Also try to extract from article header
         if metadata['title'] == 'Unknown':
-            title_tag = soup.find('h1') or soup.find('h2')
+            title_tag = tree.css_first('h1') or tree.css_first('h2')
             if title_tag:
-                metadata['title'] = title_tag.get_text(strip=True)
+                metadata['title'] = title_tag.text(strip=True)
 
         if metadata['author'] == 'Unknown':
             # Look for author link in the page metadata
-            author_links = soup.find_all('a', href=True)
-            for link in author_links:
-                if 'author' in link.get('href', ''):
-                    metadata['author'] = link.get_text(strip=True)
-                    break
+            author_link = tree.css_first('a[href*="author"]')
+            if author_link:
+                metadata['author'] = author_link.text(strip=True)
 
-        # Find all images in the article content
-        article_images = []
-        content_div = soup.find('article') or soup.find('div', class_='entry-content') or soup.body
+        # Find all images in the article content, keyed by canonical URL so the
+        # same image used in the header and the body is only listed once
+        article_images = {}
+        content_div = tree.css_first('article') or tree.css_first('div.entry-content') or tree.body
 
         if content_div:
-            images = content_div.find_all('img')
+            images = content_div.css('img')
             for img in images:
-                img_url = img.get('src') or img.get('data-src')
+                attrs = img.attributes
+                img_url = _image_source(attrs)
                 if img_url:
-                    # Convert to absolute URL
-                    img_url = urljoin(url, img_url)
-
-                    # Skip tiny images by URL patterns
-                    if 'icon' in img_url.lower() or 'logo' in img_url.lower():
+                    # Skip tiny images and thumbnails by URL patterns
+                    if _SKIP_IMAGE_RE.search(img_url):
                         continue
 
-                    # Check HTML dimensions if available
-                    width = img.get('width')
-                    height = img.get('height')
-
-                    # Skip images with tiny dimensions in HTML
+                    # Skip images with tiny dimensions in HTML (when both are given)
+                    width, height = attrs.get('width'), attrs.get('height')
                     if width and height:
                         try:
-                            if int(width) < 50 or int(height) < 50:
+                            if min(int(width), int(height)) < 50:
                                 continue
                         except (ValueError, TypeError):
                             pass
 
-                    # Skip common thumbnail sizes
-                    if '-150x150' in img_url or '-300x' in img_url or 'thumbnail' in img_url:
-                        continue
+                    # Convert to absolute URL
+                    img_url = urljoin(url, img_url)
 
-                    article_images.append({
+                    article_images.setdefault(_canonical_image_url(img_url), {
                         'image_url': img_url,
                         'author': metadata['author'],
                         'title': metadata['title'],
@@ -187,122 +390,186 @@ class SocksStudioScraper:
                     })
 
         print(f"Found {len(article_images)} images", flush=True)
-        return article_images
+        return list(article_images.values())
 
-    def download_image(self, image_data, index):
-        """Download a single image"""
+    def download_image(self, image_data):
+        """Download a single image, unless an earlier run already saved it"""
         img_url = image_data['image_url']
 
         try:
-            response = self.session.get(img_url, timeout=15, stream=True)
-            response.raise_for_status()
-
-            # Generate filename
+            # Generate filename; the URL hash makes it stable across runs
             parsed = urlparse(img_url)
-            original_filename = os.path.basename(parsed.path)
-            ext = os.path.splitext(original_filename)[1] or '.jpg'
+            original_filename = posixpath.basename(parsed.path)
+            ext = posixpath.splitext(original_filename)[1] or '.jpg'
 
             # Create safe filename
-            safe_title = re.sub(r'[^\w\s-]', '', image_data['title'])[:50]
-            safe_title = re.sub(r'[-\s]+', '_', safe_title)
-            filename = f"{index:04d}_{safe_title}{ext}"
+            safe_title = _FN_STRIP_RE.sub('', image_data['title'])[:50]
+            safe_title = _FN_COLLAPSE_RE.sub('_', safe_title)
+            url_key = hashlib.sha1(img_url.encode()).hexdigest()[:16]
+            filename = f"{url_key}_{safe_title}{ext}"
 
             filepath = self.images_dir / filename
 
-            # Download image
-            with open(filepath, 'wb') as f:
-                for chunk in response.iter_content(chunk_size=8192):
-                    f.write(chunk)
+            # Resume: a file that made it past the size check last time is complete
+            if filepath.exists():
+                file_size = filepath.stat().st_size
+                if file_size >= MIN_IMAGE_BYTES:
+                    print(f"Already downloaded: {filename}", flush=True)
+                    image_data['local_filename'] = filename
+                    image_data['file_size_bytes'] = file_size
+                    return DownloadStatus.ALREADY_DOWNLOADED
+
+            response = self.session.get(img_url, timeout=15, stream=True)
+            response.raise_for_status()
+
+            # With stream=True only the headers have arrived so far; when the server
+            # reports an (uncompressed) size, reject small files before reading the
+            # body or touching the disk
+            content_length = response.headers.get('Content-Length')
+            if content_length and 'Content-Encoding' not in response.headers:
+                if int(content_length) < MIN_IMAGE_BYTES:
+                    response.close()
+                    print(f"Skipped (too small: {content_length} bytes)", flush=True)
+                    return DownloadStatus.SKIPPED
+
+            # Download image, copying the raw stream to disk in 1MB blocks. Write to
+            # a .part file and rename when done, so an interrupted download is never
+            # mistaken for a finished one on the next run.
+            part_path = filepath.with_name(filename + '.part')
+            response.raw.decode_content = True
+            with open(part_path, 'wb', buffering=COPY_BUFFER_SIZE) as f:
+                shutil.copyfileobj(response.raw, f, length=COPY_BUFFER_SIZE)
+                file_size = f.tell()  # Bytes written; saves a stat() afterwards
 
             # Check file size - skip if too small (likely not artwork)
-            file_size = os.path.getsize(filepath)
-            if file_size < 5000:  # Less than 5KB is likely not an artwork
-                os.remove(filepath)
+            if file_size < MIN_IMAGE_BYTES:
+                part_path.unlink()
                 print(f"Skipped (too small: {file_size} bytes)", flush=True)
-                return False
+                return DownloadStatus.SKIPPED
+            part_path.replace(filepath)
 
             print(f"Downloaded: {filename} ({file_size // 1024}KB)", flush=True)
 
             # Add filename to metadata
             image_data['local_filename'] = filename
             image_data['file_size_bytes'] = file_size
-            return True
+            return DownloadStatus.DOWNLOADED
 
         except Exception as e:
             print(f"Error downloading {img_url}: {e}", flush=True)
             image_data['local_filename'] = 'FAILED'
-            return False
+            return DownloadStatus.FAILED
 
-    def save_metadata_incremental(self, image_data):
-        """Save a single image's metadata incrementally to CSV and JSON"""
-        csv_path = self.output_dir / "metadata.csv"
-        json_path = self.output_dir / "metadata.json"
-
-        # Append to CSV
-        file_exists = csv_path.exists()
-        with open(csv_path, 'a', newline='', encoding='utf-8') as f:
-            writer = csv.DictWriter(f, fieldnames=image_data.keys())
-            if not file_exists:
-                writer.writeheader()
-            writer.writerow(image_data)
-
-        # Update JSON (read all, append, write all)
-        if json_path.exists():
-            with open(json_path, 'r', encoding='utf-8') as f:
-                try:
-                    all_data = json.load(f)
-                except json.JSONDecodeError:
-                    all_data = []
-        else:
-            all_data = []
+    def _migrate_metadata_json(self):
+        """Seed metadata.jsonl from a metadata.json written by an earlier version"""
+        try:
+            all_data = orjson.loads(self.json_path.read_bytes())
+        except orjson.JSONDecodeError:
+            return
+        with open(self.jsonl_path, 'wb') as f:
+            for image_data in all_data:
+                f.write(orjson.dumps(image_data) + b'\n')
+
+    def _close_outputs(self):
+        """Flush and close the incremental metadata files"""
+        self._csv_file.close()
+        self._jsonl.close()
 
-        all_data.append(image_data)
+    def save_metadata_incremental(self, image_data):
+        """Save a single image's metadata incrementally to CSV and JSON Lines"""
+        self._csv_writer.writerow(image_data)
 
-        with open(json_path, 'w', encoding='utf-8') as f:
-            json.dump(all_data, f, indent=2, ensure_ascii=False)
+        # Append one line to the JSONL log (no read-modify-write of the whole file)
+        self._jsonl.write(orjson.dumps(image_data) + b'\n')
 
     def save_metadata(self):
-        """Save final summary"""
-        print(f"\nMetadata saved incrementally to:", flush=True)
-        print(f"  - {self.output_dir / 'metadata.csv'}", flush=True)
-        print(f"  - {self.output_dir / 'metadata.json'}", flush=True)
+        """Consolidate the JSONL log into metadata.json and print a summary"""
+        self._close_outputs()
+
+        # Keyed by image URL so a record logged by more than one run appears once
+        all_data = {}
+        with open(self.jsonl_path, 'rb') as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    record = orjson.loads(line)
+                except orjson.JSONDecodeError:
+                    continue
+                all_data[record.get('image_url')] = record
+
+        self.json_path.write_bytes(orjson.dumps(list(all_data.values()), option=orjson.OPT_INDENT_2))
+
+        print(f"\nMetadata saved to:", flush=True)
+        print(f"  - {self.csv_path}", flush=True)
+        print(f"  - {self.jsonl_path} (written incrementally)", flush=True)
+        print(f"  - {self.json_path}", flush=True)
 
     def run(self):
         """Main scraping process"""
+        asyncio.run(self._run())
+
+    async def _run(self):
         print("Starting Socks Studio scraper...")
         print(f"Output directory: {self.output_dir.absolute()}\n")
 
-        # Step 1: Get all article URLs
-        article_urls = self.get_all_article_urls()
-
-        if not article_urls:
-            print("No articles found!")
-            return
-
-        # Step 2: Process each article and download images immediately
-        image_counter = 0
-        downloaded_counter = 0
-        for i, article_url in enumerate(article_urls, 1):
-            print(f"\n[{i}/{len(article_urls)}] Processing article...", flush=True)
-            images = self.extract_metadata_from_article(article_url)
-
-            # Download images immediately
-            for image_data in images:
-                image_counter += 1
-                print(f"  [{image_counter}] Downloading image...", end=" ", flush=True)
-                success = self.download_image(image_data, downloaded_counter + 1)
-
-                if success:
-                    downloaded_counter += 1
-                    self.metadata.append(image_data)
-                    # Save metadata incrementally after each successful download
-                    self.save_metadata_incremental(image_data)
-
-            time.sleep(1)  # Be respectful to the server
+        self._page_semaphore = asyncio.Semaphore(PAGE_CONCURRENCY)
+        connector = aiohttp.TCPConnector(limit=PAGE_CONCURRENCY, keepalive_timeout=30)
+        timeout = aiohttp.ClientTimeout(total=10)
+        async with aiohttp.ClientSession(connector=connector, timeout=timeout,
+                                         headers=dict(self.session.headers)) as http:
+            # Step 1: Get all article URLs
+            article_urls = await self.get_all_article_urls(http)
+
+            if not article_urls:
+                print("No articles found!")
+                return
+
+            # Step 2: Fetch articles concurrently and download each one's images as soon as it arrives
+            image_counter = 0
+            downloaded_counter = 0
+            already_counter = 0
+            tasks = [asyncio.ensure_future(self.extract_metadata_from_article(http, article_url))
+                     for article_url in article_urls]
+            loop = asyncio.get_running_loop()
+            for i, task in enumerate(asyncio.as_completed(tasks), 1):
+                images = await task
+
+                # Skip images another article already queued (shared banners, reused figures)
+                new_images = []
+                for image_data in images:
+                    key = _canonical_image_url(image_data['image_url'])
+                    if key not in self._seen_urls:
+                        self._seen_urls.add(key)
+                        new_images.append(image_data)
+                images = new_images
+                print(f"\n[{i}/{len(article_urls)}] Downloading {len(images)} images...", flush=True)
+
+                # Download the article's images in parallel on the thread pool; the
+                # event loop keeps fetching other articles meanwhile
+                results = await asyncio.gather(*(
+                    loop.run_in_executor(self.pool, self.download_image, image_data)
+                    for image_data in images
+                ))
+                image_counter += len(images)
+
+                for image_data, status in zip(images, results):
+                    if status is DownloadStatus.ALREADY_DOWNLOADED:
+                        # Recorded in the JSONL/CSV by the run that downloaded it
+                        already_counter += 1
+                    elif status is DownloadStatus.DOWNLOADED:
+                        downloaded_counter += 1
+                        self.metadata.append(image_data)
+                        # Save metadata incrementally after each successful download
+                        self.save_metadata_incremental(image_data)
+
+        self.pool.shutdown()
 
         print(f"\n\nTotal images found: {image_counter}", flush=True)
         print(f"Total images downloaded: {downloaded_counter}", flush=True)
-        print(f"Skipped (too small): {image_counter - downloaded_counter}", flush=True)
+        print(f"Already downloaded: {already_counter}", flush=True)
+        print(f"Skipped (too small): {image_counter - downloaded_counter - already_counter}", flush=True)
 
         # Step 3: Save metadata
         self.save_metadata()
@@ -12,7 +12,7 @@ headers = {
 response = requests.get(url, headers=headers, timeout=10)
 print(f"Status code: {response.status_code}")
 
-soup = BeautifulSoup(response.text, 'html.parser')
+soup = BeautifulSoup(response.content, 'lxml')
 
 # Find all article tags
 articles = soup.find_all('article')